@@ -4,10 +4,14 @@ Defines core agent capabilities and protocols with Pydantic models.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Type, Generic, TypeVar
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, Optional, List, Tuple, Type, Generic, TypeVar
+from pydantic import BaseModel, ConfigDict, Field, validator
+from typing_extensions import TypedDict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 import structlog
+import sys
+import time
 import uuid
 import instructor
 
@@ -24,25 +28,44 @@ class AgentCapability(BaseModel):
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Capability parameters")
     enabled: bool = Field(default=True, description="Whether capability is enabled")
     version: str = Field(default="1.0", description="Capability version")
-    dependencies: List[str] = Field(default_factory=list, description="Required dependencies")
+    # Immutable default: shared by every capability instead of a fresh list each
+    dependencies: Tuple[str, ...] = Field(default=(), description="Required dependencies")
     
     @validator('name')
     def validate_name(cls, v):
         if not v or not v.strip():
             raise ValueError("Capability name cannot be empty")
-        return v.strip()
+        return sys.intern(v.strip())
+
+class AgentTaskInput(TypedDict, total=False):
+    """Known agent task input keys; agent-specific extras are passed through."""
+    __pydantic_config__ = ConfigDict(extra="allow")
+    
+    query: str
+    context: str
+    files: List[str]
+    repository_id: str
+    code_content: str
+    context_chunks: Optional[List[Any]]
+    conversation_history: List[Any]
+    context_files: List[Any]
 
 class AgentTask(BaseModel):
     """Enhanced agent task definition with structured parameters."""
     task_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique task ID")
     task_type: str = Field(..., description="Type of task")
-    input_data: Dict[str, Any] = Field(..., description="Task input data")
+    input_data: AgentTaskInput = Field(..., description="Task input data")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Task parameters")
     priority: int = Field(default=1, ge=1, le=10, description="Task priority (1-10)")
     created_at: datetime = Field(default_factory=datetime.now, description="Task creation time")
     timeout: Optional[int] = Field(default=None, ge=1, description="Task timeout in seconds")
     expected_output_type: Optional[str] = Field(default=None, description="Expected output type")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional task metadata")
+    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional task metadata")
+    
+    @validator('task_type')
+    def intern_task_type(cls, v):
+        # Task types are matched against capability names on every dispatch
+        return sys.intern(v)
 
 class AgentResult(BaseModel):
     """Enhanced agent execution result with structured output."""
@@ -50,16 +73,10 @@ class AgentResult(BaseModel):
     success: bool = Field(..., description="Whether task was successful")
     output: Dict[str, Any] = Field(..., description="Task output")
     error_message: Optional[str] = Field(default=None, description="Error message if failed")
-    execution_time: float = Field(..., description="Execution time in seconds")
+    execution_time: float = Field(..., ge=0, description="Execution time in seconds")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     completed_at: datetime = Field(default_factory=datetime.now, description="Completion time")
     structured_output: Optional[Dict[str, Any]] = Field(default=None, description="Structured output if available")
-    
-    @validator('execution_time')
-    def validate_execution_time(cls, v):
-        if v < 0:
-            raise ValueError("Execution time must be non-negative")
-        return v
 
 class StructuredAgentResult(BaseModel, Generic[T]):
     """Structured agent result with typed output."""
@@ -69,21 +86,26 @@ class StructuredAgentResult(BaseModel, Generic[T]):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     completed_at: datetime = Field(default_factory=datetime.now, description="Completion time")
 
-class AgentHealthStatus(BaseModel):
-    """Agent health status report."""
-    agent_id: str = Field(..., description="Agent ID")
-    is_healthy: bool = Field(..., description="Overall health status")
-    capabilities_status: Dict[str, bool] = Field(default_factory=dict, description="Status of each capability")
-    last_check: datetime = Field(default_factory=datetime.now, description="Last health check time")
-    issues: List[str] = Field(default_factory=list, description="Health issues found")
-    metrics: Dict[str, float] = Field(default_factory=dict, description="Health metrics")
+@dataclass(slots=True)
+class AgentHealthStatus:
+    """Agent health status report (built in-process, so not validated)."""
+    agent_id: str
+    is_healthy: bool
+    capabilities_status: Dict[str, bool] = field(default_factory=dict)
+    last_check: datetime = field(default_factory=datetime.now)
+    issues: List[str] = field(default_factory=list)
+    metrics: Dict[str, float] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a plain dictionary."""
+        return asdict(self)
 
 class BaseAgent(ABC):
     """Enhanced base agent with Instructor support for structured outputs."""
     
     def __init__(self, agent_id: str = None, name: str = None, description: str = None):
         """Initialize the agent with Instructor support."""
-        self.agent_id = agent_id or str(uuid.uuid4())
+        self.agent_id = sys.intern(agent_id or str(uuid.uuid4()))
         self.name = name or self.__class__.__name__
         self.description = description or f"{self.name} agent"
         self.capabilities: List[AgentCapability] = []
@@ -112,6 +134,9 @@ class BaseAgent(ABC):
         
         # Initialize capabilities
         self._initialize_capabilities()
+        self._capability_index: Dict[str, AgentCapability] = {
+            cap.name: cap for cap in self.capabilities
+        }
     
     def _setup_instructor(self) -> None:
         """Setup Instructor client for structured outputs."""
@@ -161,7 +186,7 @@ class BaseAgent(ABC):
             raise RuntimeError("Instructor client not available")
         
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             # Get structured input for the task
             structured_input = await self._prepare_structured_input(task)
@@ -178,7 +203,7 @@ class BaseAgent(ABC):
                 temperature=0.3
             )
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             return StructuredAgentResult(
                 task_id=task.task_id,
@@ -204,9 +229,9 @@ class BaseAgent(ABC):
     async def can_handle(self, task: AgentTask) -> bool:
         """Check if the agent can handle a specific task."""
         # Check capability match
-        for capability in self.capabilities:
-            if capability.enabled and capability.name == task.task_type:
-                return True
+        capability = self._capability_index.get(task.task_type)
+        if capability is not None and capability.enabled:
+            return True
         
         # Check task parameters
         required_capabilities = task.parameters.get("required_capabilities", [])
@@ -222,7 +247,8 @@ class BaseAgent(ABC):
     
     def has_capability(self, capability_name: str) -> bool:
         """Check if agent has a specific capability."""
-        return any(cap.name == capability_name and cap.enabled for cap in self.capabilities)
+        capability = self._capability_index.get(capability_name)
+        return capability is not None and capability.enabled
     
     async def health_check(self) -> AgentHealthStatus:
         """Enhanced health check with detailed status."""
@@ -341,7 +367,8 @@ class BaseAgent(ABC):
         """Create an enhanced agent result."""
         await self._update_performance_metrics(task, execution_time, success, error_message)
         
-        return AgentResult(
+        # Built from agent-internal values only, so skip re-validation
+        return AgentResult.model_construct(
             task_id=task.task_id,
             success=success,
             output=output,
@@ -419,20 +446,30 @@ class BaseAgent(ABC):
 class EnhancedAgentRegistry:
     """Enhanced registry for managing agents with health monitoring."""
     
+    __slots__ = ("agents", "health_cache", "last_health_check", "_type_index")
+    
     def __init__(self):
         self.agents: Dict[str, BaseAgent] = {}
         self.health_cache: Dict[str, AgentHealthStatus] = {}
-        self.last_health_check: datetime = None
+        # Monotonic seconds of the last full health sweep
+        self.last_health_check: Optional[float] = None
+        # Memoized get_agents_by_type() results, keyed by lowercased type
+        self._type_index: Dict[str, List[BaseAgent]] = {}
     
     def register(self, agent: BaseAgent) -> None:
         """Register an agent with validation."""
         if not isinstance(agent, BaseAgent):
             raise ValueError("Agent must inherit from BaseAgent")
         
-        if agent.agent_id in self.agents:
+        existing = self.agents.get(agent.agent_id)
+        if existing is agent:
+            # Same instance re-registered: nothing to update or invalidate
+            return
+        if existing is not None:
             logger.warning("Agent already registered, updating", agent_id=agent.agent_id)
         
         self.agents[agent.agent_id] = agent
+        self._type_index.clear()
         logger.info(
             "Agent registered",
             agent_id=agent.agent_id,
@@ -445,6 +482,7 @@ class EnhancedAgentRegistry:
         if agent_id in self.agents:
             agent = self.agents[agent_id]
             del self.agents[agent_id]
+            self._type_index.clear()
             if agent_id in self.health_cache:
                 del self.health_cache[agent_id]
             logger.info("Agent unregistered", agent_id=agent_id)
@@ -468,6 +506,10 @@ class EnhancedAgentRegistry:
     def get_agents_by_type(self, agent_type: str) -> List[BaseAgent]:
         """Get agents by type."""
         agent_type_lower = agent_type.lower()
+        cached = self._type_index.get(agent_type_lower)
+        if cached is not None:
+            return list(cached)
+        
         matching_agents = []
         
         for agent in self.agents.values():
@@ -479,15 +521,16 @@ class EnhancedAgentRegistry:
                 agent_name_lower.replace(' ', '_') in agent_type_lower):
                 matching_agents.append(agent)
         
-        return matching_agents
+        self._type_index[agent_type_lower] = matching_agents
+        return list(matching_agents)
     
     async def health_check_all(self) -> Dict[str, AgentHealthStatus]:
         """Check health of all agents with caching."""
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         # Check if we need fresh health checks
-        if (not self.last_health_check or 
-            (current_time - self.last_health_check).seconds > 300):  # 5 minutes cache
+        if (self.last_health_check is None or 
+            current_time - self.last_health_check > 300):  # 5 minutes cache
             
             for agent_id, agent in self.agents.items():
                 try:
@@ -529,10 +572,13 @@ class EnhancedAgentRegistry:
         return results
 
 
-# Global enhanced agent registry
-enhanced_agent_registry = EnhancedAgentRegistry()
+# Global enhanced agent registry (built on first use)
+_enhanced_agent_registry: Optional[EnhancedAgentRegistry] = None
 
 
 def get_enhanced_agent_registry() -> EnhancedAgentRegistry:
     """Get the global enhanced agent registry."""
-    return enhanced_agent_registry
+    global _enhanced_agent_registry
+    if _enhanced_agent_registry is None:
+        _enhanced_agent_registry = EnhancedAgentRegistry()
+    return _enhanced_agent_registry
@@ -53,8 +53,9 @@ class CodeChatAgent(BaseAgent):
     
     def _initialize_capabilities(self) -> None:
         """Initialize agent capabilities."""
+        # Static, trusted definitions: skip pydantic validation on construction
         self.capabilities = [
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="intelligent_code_chat",
                 description="Intelligent code chat with query classification and context-aware responses",
                 parameters={
@@ -64,7 +65,7 @@ class CodeChatAgent(BaseAgent):
                     "response_style_adaptation": True
                 }
             ),
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="code_analysis",
                 description="Analyze code functionality with structured insights",
                 parameters={
@@ -73,7 +74,7 @@ class CodeChatAgent(BaseAgent):
                     "structured_output": True
                 }
             ),
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="debugging_assistance",
                 description="Provide structured debugging assistance with fixes",
                 parameters={
@@ -82,7 +83,7 @@ class CodeChatAgent(BaseAgent):
                     "structured_output": True
                 }
             ),
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="casual_conversation",
                 description="Handle casual conversations and greetings naturally",
                 parameters={
@@ -64,8 +64,9 @@ class DocumentationAgent(BaseAgent):
     
     def _initialize_capabilities(self) -> None:
         """Initialize agent capabilities."""
+        # Static, trusted definitions: skip pydantic validation on construction
         self.capabilities = [
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="docstring_generation",
                 description="Generate comprehensive docstrings with structured output",
                 parameters={
@@ -74,7 +75,7 @@ class DocumentationAgent(BaseAgent):
                     "structured_output": True
                 }
             ),
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="api_documentation",
                 description="Generate structured API documentation",
                 parameters={
@@ -83,7 +84,7 @@ class DocumentationAgent(BaseAgent):
                     "structured_output": True
                 }
             ),
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="readme_generation",
                 description="Generate structured README files",
                 parameters={
@@ -92,7 +93,7 @@ class DocumentationAgent(BaseAgent):
                     "structured_output": True
                 }
             ),
-            AgentCapability(
+            AgentCapability.model_construct(
                 name="technical_writing",
                 description="Create technical documentation with structure",
                 parameters={
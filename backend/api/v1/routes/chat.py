@@ -53,14 +53,13 @@ class CreateSessionRequest(BaseModel):
     branch: Optional[str] = None
 
 
-class CreateSessionResponse(BaseModel):
+class SessionResponse(BaseModel):
     success: bool
     session: Dict[str, Any]
 
 
-class GetSessionResponse(BaseModel):
-    success: bool
-    session: Dict[str, Any]
+# Create/get/update all return the same envelope; share one schema
+CreateSessionResponse = GetSessionResponse = UpdateSessionResponse = SessionResponse
 
 
 class GetSessionMessagesResponse(BaseModel):
@@ -75,11 +74,6 @@ class UpdateSessionRequest(BaseModel):
     branch: Optional[str] = None
 
 
-class UpdateSessionResponse(BaseModel):
-    success: bool
-    session: Dict[str, Any]
-
-
 class DeleteSessionResponse(BaseModel):
     success: bool
     message: str
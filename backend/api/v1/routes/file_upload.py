@@ -3,6 +3,8 @@ File upload routes for handling file imports and processing.
 Replicates the JavaScript backend multer file upload functionality.
 """
 
+import asyncio
+import base64
 import os
 import uuid
 import aiofiles
@@ -16,6 +18,7 @@ from datetime import datetime
 from .auth import get_current_user
 from utils.file_utils import get_file_processor, detect_file_type, detect_language
 from core.orchestrator import get_orchestrator
+from config.session_config import get_session_config
 from models.api.auth_models import User
 from models.api.file_models import FileMetadata, FileUploadResponse, FileType
 
@@ -29,36 +32,42 @@ UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 # Maximum file size (10MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# Maximum concurrent GitHub content requests per import
+GITHUB_IMPORT_CONCURRENCY = 8
+
+# Maximum uploads saved and read back concurrently per import
+UPLOAD_IO_CONCURRENCY = 16
+
 # Allowed file types for processing
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     '.txt', '.md', '.py', '.js', '.ts', '.jsx', '.tsx', '.html', '.css', 
     '.scss', '.sass', '.json', '.yaml', '.yml', '.xml', '.csv', '.sql',
     '.java', '.cpp', '.c', '.cs', '.php', '.rb', '.go', '.rs', '.swift',
     '.kt', '.scala', '.dart', '.vue', '.svelte', '.r', '.m', '.pl', '.sh',
     '.bash', '.zsh', '.fish', '.ps1', '.bat', '.dockerfile', '.makefile',
     '.gitignore', '.env', '.ini', '.cfg', '.conf', '.log'
-}
+})
+_SORTED_ALLOWED_EXTENSIONS = sorted(ALLOWED_EXTENSIONS)
+_ALLOWED_EXTENSIONS_TEXT = ', '.join(_SORTED_ALLOWED_EXTENSIONS)
 
-async def save_uploaded_file(file: UploadFile, user_id: str) -> tuple[str, FileMetadata]:
-    """Save uploaded file to disk and return file path and metadata"""
+async def save_uploaded_file(file: UploadFile, user_id: str) -> tuple[str, FileMetadata, str]:
+    """Save uploaded file to disk and return file path, metadata and text content"""
     
-    # Validate file size
-    content = await file.read()
+    # Validate file size; reading one byte past the limit is enough to reject
+    # an oversized upload without buffering all of it
+    content = await file.read(MAX_FILE_SIZE + 1)
     if len(content) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=413, 
             detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024*1024)}MB"
         )
     
-    # Reset file pointer
-    await file.seek(0)
-    
     # Validate file extension
     file_extension = Path(file.filename).suffix.lower() if file.filename else ''
     if file_extension not in ALLOWED_EXTENSIONS and file_extension:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type: {file_extension}. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            detail=f"Unsupported file type: {file_extension}. Allowed types: {_ALLOWED_EXTENSIONS_TEXT}"
         )
     
     # Generate unique filename
@@ -73,13 +82,11 @@ async def save_uploaded_file(file: UploadFile, user_id: str) -> tuple[str, FileM
     
     file_path = user_upload_dir / unique_filename
     
-    # Save file
+    # Save file (content was already read for the size check)
     async with aiofiles.open(file_path, 'wb') as f:
-        content = await file.read()
         await f.write(content)
     
     # Detect file type and language
-    content_str = content.decode('utf-8', errors='ignore')
     detected_file_type = await detect_file_type(str(file_path))
     detected_language = await detect_language(str(file_path))
     
@@ -96,7 +103,7 @@ async def save_uploaded_file(file: UploadFile, user_id: str) -> tuple[str, FileM
         status="completed"
     )
     
-    return str(file_path), metadata
+    return str(file_path), metadata, content.decode('utf-8', errors='ignore')
 
 @router.post("/import", response_model=FileUploadResponse)
 async def import_files(
@@ -136,64 +143,28 @@ async def import_files(
         if not orchestrator:
             raise HTTPException(status_code=503, detail="AI system not initialized")
         
-        # Process each file
-        for file in files:
+        semaphore = asyncio.Semaphore(UPLOAD_IO_CONCURRENCY)
+        
+        async def stage_file(file: UploadFile) -> Optional[tuple]:
             try:
-                # Save file to disk
-                file_path, metadata = await save_uploaded_file(file, current_user.id)
-                
-                # Read file content for processing
-                async with aiofiles.open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = await f.read()
-                
-                # Process file with orchestrator
-                try:
-                    # Create file data for processing
-                    file_data = {
-                        "path": file.filename or metadata.filename,
-                        "content": content,
-                        "branch": branch,
-                        "size": metadata.size,
-                        "repository_id": repository_id,
-                        "language": metadata.language,
-                        "file_type": metadata.file_type.value if metadata.file_type else "text",
-                        "is_public": True,
-                        "uploaded_at": metadata.uploaded_at.isoformat()
-                    }
-                    
-                    # Process with RAG system
-                    processing_result = await orchestrator.process_session_files(
-                        session_id=f"upload_{current_user.id}_{uuid.uuid4()}",
-                        files=[file_data]
-                    )
-                    
-                    if processing_result:
-                        processing_jobs.append(f"processed_{metadata.file_id}")
-                        logger.info("File processed successfully", 
-                                   filename=metadata.filename, 
-                                   file_id=metadata.file_id)
-                    else:
-                        logger.warning("File processing returned no result", 
-                                     filename=metadata.filename)
-                
-                except Exception as processing_error:
-                    logger.error("File processing failed", 
-                               filename=metadata.filename, 
-                               error=str(processing_error))
-                    # Still mark as uploaded, just note processing failed
-                    failed_files.append({
-                        "filename": metadata.filename,
-                        "error": f"Processing failed: {str(processing_error)}"
-                    })
+                async with semaphore:
+                    # Save file to disk; the content is reused rather than read back
+                    file_path, metadata, content = await save_uploaded_file(file, current_user.id)
                 
-                uploaded_files.append(metadata)
+                # Create file data for processing
+                file_data = {
+                    "path": file.filename or metadata.filename,
+                    "content": content,
+                    "branch": branch,
+                    "size": metadata.size,
+                    "repository_id": repository_id,
+                    "language": metadata.language,
+                    "file_type": metadata.file_type.value if metadata.file_type else "text",
+                    "is_public": True,
+                    "uploaded_at": metadata.uploaded_at.isoformat()
+                }
+                return file_path, metadata, file_data
                 
-                # Clean up temporary file after processing
-                try:
-                    os.remove(file_path)
-                except OSError:
-                    pass  # File cleanup is not critical
-                    
             except Exception as file_error:
                 logger.error("File upload failed", 
                            filename=file.filename, 
@@ -202,6 +173,47 @@ async def import_files(
                     "filename": file.filename or "unknown",
                     "error": str(file_error)
                 })
+                return None
+        
+        # Save the uploads concurrently, then run them through the
+        # RAG system in session-sized batches
+        staged_files = [
+            staged for staged in await asyncio.gather(*(stage_file(file) for file in files))
+            if staged
+        ]
+        
+        batch_size = get_session_config().max_files_per_session
+        for start in range(0, len(staged_files), batch_size):
+            batch = staged_files[start:start + batch_size]
+            errors = await orchestrator.process_session_files_detailed(
+                session_id=f"upload_{current_user.id}_{uuid.uuid4()}",
+                files=[file_data for _, _, file_data in batch]
+            )
+            
+            for (_, metadata, _), error in zip(batch, errors):
+                if error is None:
+                    processing_jobs.append(f"processed_{metadata.file_id}")
+                    logger.info("File processed successfully", 
+                               filename=metadata.filename, 
+                               file_id=metadata.file_id)
+                else:
+                    logger.error("File processing failed", 
+                               filename=metadata.filename, 
+                               error=error)
+                    # Still mark as uploaded, just note processing failed
+                    failed_files.append({
+                        "filename": metadata.filename,
+                        "error": f"Processing failed: {error}"
+                    })
+        
+        for file_path, metadata, _ in staged_files:
+            uploaded_files.append(metadata)
+            
+            # Clean up temporary file after processing
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass  # File cleanup is not critical
         
         # Return results
         response = FileUploadResponse(
@@ -261,35 +273,41 @@ async def import_from_github(
         # Import files from GitHub using the GitHub utils
         from utils.github_utils import github_service
         
-        # Fetch files from GitHub and process them
-        processed_files = []
-        for file_path in files:
+        # Fetch files from GitHub concurrently (bounded) and process them
+        owner, repo = repository_id.split('/')[:2]
+        semaphore = asyncio.Semaphore(GITHUB_IMPORT_CONCURRENCY)
+        
+        async def fetch_file(file_path: str) -> Optional[dict]:
             try:
                 # Get file content from GitHub
-                file_content_data = await github_service.get_file_content(
-                    repository_id.split('/')[0],  # owner
-                    repository_id.split('/')[1],  # repo
-                    file_path,
-                    branch
-                )
+                async with semaphore:
+                    file_content_data = await github_service.get_file_content(
+                        owner,
+                        repo,
+                        file_path,
+                        branch
+                    )
                 
                 # Decode base64 content
-                import base64
                 content = base64.b64decode(file_content_data.get('content', '')).decode('utf-8')
                 
-                processed_files.append({
+                return {
                     "path": file_path,
                     "content": content,
                     "branch": branch,
                     "size": len(content),
                     "repository_id": repository_id,
                     "is_public": True
-                })
+                }
                 
             except Exception as file_error:
                 logger.error("Failed to fetch file from GitHub", 
                            file_path=file_path, 
                            error=str(file_error))
+                return None
+        
+        fetched_files = await asyncio.gather(*(fetch_file(file_path) for file_path in files))
+        processed_files = [file_data for file_data in fetched_files if file_data]
         
         # Process files with orchestrator
         if processed_files:
@@ -330,7 +348,7 @@ async def upload_health_check():
         "directory_exists": upload_dir_exists,
         "directory_writable": upload_dir_writable,
         "max_file_size_mb": MAX_FILE_SIZE // (1024 * 1024),
-        "allowed_extensions": sorted(ALLOWED_EXTENSIONS),
+        "allowed_extensions": list(_SORTED_ALLOWED_EXTENSIONS),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -2,6 +2,7 @@
 GitHub API integration routes
 """
 
+import asyncio
 import os
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
@@ -373,13 +374,16 @@ async def get_repository_stats(
     """Get repository statistics."""
     try:
         # Fetch various repository data in parallel
-        details = await github_service.get_repository_details(owner, repo, token=token)
-        branches = await github_service.get_repository_branches(owner, repo, token=token)
-        issues = await github_service.get_repository_issues(owner, repo, 'open', token=token)
-        pull_requests = await github_service.get_repository_pull_requests(owner, repo, 'open', token=token)
-        commits = await github_service.get_repository_commits(owner, repo, 'main', 1, 100, token=token)
-        contributors = await github_service.get_repository_contributors(owner, repo, token=token)
-        languages = await github_service.get_repository_languages(owner, repo, token=token)
+        (details, branches, issues, pull_requests,
+         commits, contributors, languages) = await asyncio.gather(
+            github_service.get_repository_details(owner, repo, token=token),
+            github_service.get_repository_branches(owner, repo, token=token),
+            github_service.get_repository_issues(owner, repo, 'open', token=token),
+            github_service.get_repository_pull_requests(owner, repo, 'open', token=token),
+            github_service.get_repository_commits(owner, repo, 'main', 1, 100, token=token),
+            github_service.get_repository_contributors(owner, repo, token=token),
+            github_service.get_repository_languages(owner, repo, token=token)
+        )
         
         # Calculate statistics
         stats = {
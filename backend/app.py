@@ -16,8 +16,16 @@ from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
+# orjson serializes response bodies several times faster than the stdlib encoder
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import core components
 from core.orchestrator import get_orchestrator, initialize_orchestrator, shutdown_orchestrator
 from agents.base.base_agent import get_enhanced_agent_registry
@@ -108,6 +116,10 @@ async def lifespan(app: FastAPI):
         # Shutdown orchestrator first
         await shutdown_orchestrator()
         
+        # Release the shared GitHub HTTP session
+        from utils.github_utils import github_service
+        await github_service.client.close()
+        
         # Shutdown database connections
         from config.database import close_database
         await close_database()
@@ -124,7 +136,8 @@ app = FastAPI(
     title="Beetle RAG System",
     description="Advanced RAG system with session-based context management and multi-agent architecture",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # Add CORS middleware
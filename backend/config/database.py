@@ -5,14 +5,16 @@ Supports both local PostgreSQL and hosted Supabase with automatic provider detec
 
 import os
 import asyncio
+import threading
 from typing import Optional, Dict, Any, Union, AsyncGenerator
 from enum import Enum
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
+from functools import lru_cache
 import structlog
 
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy import text
 
 logger = structlog.get_logger(__name__)
@@ -23,6 +25,8 @@ class DatabaseProvider(str, Enum):
     SUPABASE = "supabase"
     SQLITE = "sqlite"  # Development fallback
 
+_PROVIDER_VALUES = frozenset(provider.value for provider in DatabaseProvider)
+
 class DatabaseSettings(BaseSettings):
     """Database configuration settings."""
     
@@ -31,42 +35,50 @@ class DatabaseSettings(BaseSettings):
     # ========================
     
     # Provider Selection
-    database_provider: str = Field(default="sqlite", env="DATABASE_PROVIDER")
+    database_provider: str = Field(default="sqlite", validation_alias="DATABASE_PROVIDER")
     
     # PostgreSQL Settings
-    postgres_host: str = Field(default="localhost", env="POSTGRES_HOST")
-    postgres_port: int = Field(default=5432, env="POSTGRES_PORT")
-    postgres_db: str = Field(default="gitmesh_rag", env="POSTGRES_DB")
-    postgres_user: str = Field(default="GitMesh", env="POSTGRES_USER")
-    postgres_password: str = Field(default="gitmeshpass", env="POSTGRES_PASSWORD")
-    postgres_ssl: str = Field(default="prefer", env="POSTGRES_SSL")
+    postgres_host: str = Field(default="localhost", validation_alias="POSTGRES_HOST")
+    postgres_port: int = Field(default=5432, validation_alias="POSTGRES_PORT")
+    postgres_db: str = Field(default="gitmesh_rag", validation_alias="POSTGRES_DB")
+    postgres_user: str = Field(default="GitMesh", validation_alias="POSTGRES_USER")
+    postgres_password: str = Field(default="gitmeshpass", validation_alias="POSTGRES_PASSWORD")
+    postgres_ssl: str = Field(default="prefer", validation_alias="POSTGRES_SSL")
     
     # Supabase Settings
-    supabase_url: Optional[str] = Field(default=None, env="SUPABASE_URL")
-    supabase_anon_key: Optional[str] = Field(default=None, env="SUPABASE_ANON_KEY")
-    supabase_service_role_key: Optional[str] = Field(default=None, env="SUPABASE_SERVICE_ROLE_KEY")
+    supabase_url: Optional[str] = Field(default=None, validation_alias="SUPABASE_URL")
+    supabase_anon_key: Optional[str] = Field(default=None, validation_alias="SUPABASE_ANON_KEY")
+    supabase_service_role_key: Optional[str] = Field(default=None, validation_alias="SUPABASE_SERVICE_ROLE_KEY")
     
     # Generic Database URL (overrides individual settings)
-    database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
+    database_url: Optional[str] = Field(default=None, validation_alias="DATABASE_URL")
     
     # Connection Pool Settings
-    pool_size: int = Field(default=10, env="DB_POOL_SIZE")
-    max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
-    pool_timeout: int = Field(default=30, env="DB_POOL_TIMEOUT")
-    pool_recycle: int = Field(default=3600, env="DB_POOL_RECYCLE")
+    pool_size: int = Field(default=20, validation_alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=40, validation_alias="DB_MAX_OVERFLOW")
+    pool_timeout: int = Field(default=30, validation_alias="DB_POOL_TIMEOUT")
+    pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
+    pool_pre_ping: bool = Field(default=True, validation_alias="DB_POOL_PRE_PING")
+    
+    # asyncpg prepared statement caches (set both to 0 behind pgbouncer transaction pooling)
+    statement_cache_size: int = Field(default=1024, validation_alias="DB_STATEMENT_CACHE_SIZE")
+    prepared_statement_cache_size: int = Field(default=512, validation_alias="DB_PREPARED_STATEMENT_CACHE_SIZE")
     
     # Development Settings
-    sqlite_path: str = Field(default="./beetle_dev.db", env="SQLITE_PATH")
-    create_tables: bool = Field(default=True, env="DB_CREATE_TABLES")
+    sqlite_path: str = Field(default="./beetle_dev.db", validation_alias="SQLITE_PATH")
+    create_tables: bool = Field(default=True, validation_alias="DB_CREATE_TABLES")
     
-    class Config:
-        env_prefix = "DB_"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        populate_by_name=True,
+        extra="ignore"
+    )
     
-    @validator('database_provider')
+    @field_validator('database_provider')
+    @classmethod
     def validate_provider(cls, v):
         """Validate database provider."""
-        if v not in [provider.value for provider in DatabaseProvider]:
+        if v not in _PROVIDER_VALUES:
             raise ValueError(f"Invalid database provider: {v}")
         return v
     
@@ -131,12 +143,13 @@ class DatabaseManager:
     """Database manager with support for multiple providers."""
     
     def __init__(self, settings: DatabaseSettings = None):
-        self.settings = settings or DatabaseSettings()
+        self.settings = settings or get_database_settings()
         self._engine = None
         self._async_engine = None
         self._session_factory = None
         self._async_session_factory = None
         self._supabase_client = None
+        self._sync_lock = threading.Lock()
         
         logger.info("Database manager initialized", 
                    provider=self.settings.database_provider,
@@ -185,23 +198,42 @@ class DatabaseManager:
         except Exception as e:
             logger.error("Failed to setup Supabase client", error=str(e))
     
+    def _setup_sync_engine(self):
+        """Setup the sync engine and session factory without touching the event loop."""
+        with self._sync_lock:
+            if self._session_factory is not None:
+                return
+            
+            from sqlalchemy import create_engine
+            from sqlalchemy.orm import sessionmaker
+            from sqlalchemy.pool import NullPool
+            
+            # The sync engine only serves table creation, so it must not hold a pool
+            sync_engine_kwargs = {"echo": True} if self.settings.is_sqlite else {
+                "poolclass": NullPool,
+                "echo": False
+            }
+            
+            self._engine = create_engine(self.settings.get_connection_string(), **sync_engine_kwargs)
+            self._session_factory = sessionmaker(bind=self._engine)
+    
     async def _setup_sqlalchemy(self):
         """Setup SQLAlchemy engine and session factory."""
         try:
             from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-            from sqlalchemy import create_engine
-            from sqlalchemy.orm import sessionmaker
+            
+            self._setup_sync_engine()
             
             # Connection strings
-            sync_conn_str = self.settings.get_connection_string()
             async_conn_str = self.settings.get_async_connection_string()
             
-            # Create engines
+            # Create async engine
             engine_kwargs = {
                 "pool_size": self.settings.pool_size,
                 "max_overflow": self.settings.max_overflow,
                 "pool_timeout": self.settings.pool_timeout,
                 "pool_recycle": self.settings.pool_recycle,
+                "pool_pre_ping": self.settings.pool_pre_ping,
                 "echo": self.settings.is_sqlite  # Only echo for SQLite in dev
             }
             
@@ -209,14 +241,28 @@ class DatabaseManager:
             if self.settings.is_sqlite:
                 engine_kwargs = {"echo": True}
             
-            self._engine = create_engine(sync_conn_str, **engine_kwargs)
-            self._async_engine = create_async_engine(async_conn_str, **engine_kwargs)
+            # Keep parsed plans hot per connection; JIT only slows short OLTP queries.
+            # TCP keepalives let the server drop dead peers instead of stalling on them.
+            async_engine_kwargs = dict(engine_kwargs)
+            if async_conn_str.startswith('postgresql+asyncpg://'):
+                async_engine_kwargs["connect_args"] = {
+                    "statement_cache_size": self.settings.statement_cache_size,
+                    "prepared_statement_cache_size": self.settings.prepared_statement_cache_size,
+                    "server_settings": {
+                        "jit": "off",
+                        "tcp_keepalives_idle": "30",
+                        "tcp_keepalives_interval": "10",
+                        "tcp_keepalives_count": "5"
+                    }
+                }
             
-            # Session factories
-            self._session_factory = sessionmaker(bind=self._engine)
+            self._async_engine = create_async_engine(async_conn_str, **async_engine_kwargs)
+            
+            # Session factory
             self._async_session_factory = async_sessionmaker(
                 bind=self._async_engine,
-                expire_on_commit=False
+                expire_on_commit=False,
+                autoflush=False
             )
             
             logger.info("SQLAlchemy setup completed")
@@ -247,7 +293,7 @@ class DatabaseManager:
     async def _test_connection(self):
         """Test database connection."""
         try:
-            async with self.get_async_session() as session:
+            async with self.get_read_session() as session:
                 # Simple query to test connection
                 if self.settings.is_sqlite:
                     result = await session.execute(text("SELECT 1"))
@@ -277,10 +323,19 @@ class DatabaseManager:
             finally:
                 await session.close()
     
+    @asynccontextmanager
+    async def get_read_session(self):
+        """Get async database session for reads; it is closed without a commit."""
+        if not self._async_session_factory:
+            raise RuntimeError("Database not initialized")
+        
+        async with self._async_session_factory() as session:
+            yield session
+    
     def get_session(self):
-        """Get sync database session."""
+        """Get sync database session, creating the sync engine on first use."""
         if not self._session_factory:
-            raise RuntimeError("Database not initialized")
+            self._setup_sync_engine()
         
         return self._session_factory()
     
@@ -302,7 +357,7 @@ class DatabaseManager:
     async def health_check(self) -> Dict[str, Any]:
         """Check database health."""
         try:
-            async with self.get_async_session() as session:
+            async with self.get_read_session() as session:
                 if self.settings.is_sqlite:
                     await session.execute(text("SELECT 1"))
                 else:
@@ -337,8 +392,9 @@ class DatabaseManager:
 # Global database manager instance
 _database_manager: Optional[DatabaseManager] = None
 
+@lru_cache(maxsize=1)
 def get_database_settings() -> DatabaseSettings:
-    """Get database settings."""
+    """Get database settings (environment is read once per process)."""
     return DatabaseSettings()
 
 def get_database_manager() -> DatabaseManager:
@@ -19,6 +19,7 @@ class SessionConfig(BaseSettings):
     max_files_per_session: int = 50
     max_tokens_per_session: int = 100000
     max_file_size_bytes: int = 100 * 1024 * 1024  # 100MB (fixed comment)
+    max_messages_per_session: int = 1000  # Oldest messages are dropped beyond this
     
     # Performance settings
     enable_session_caching: bool = True
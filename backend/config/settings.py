@@ -5,9 +5,10 @@ Handles environment variables, validation, and service configuration.
 
 import os
 import yaml
+from functools import cached_property, lru_cache
 from typing import Optional, List, Dict, Any
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -21,55 +22,55 @@ class Settings(BaseSettings):
     # ========================
     
     # API Keys & Secrets
-    openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
-    gemini_api_key: Optional[str] = Field(default=None, env="GEMINI_API_KEY")
-    jina_api_key: Optional[str] = Field(default=None, env="JINA_API_KEY")
+    openai_api_key: Optional[str] = Field(default=None, validation_alias="OPENAI_API_KEY")
+    gemini_api_key: Optional[str] = Field(default=None, validation_alias="GEMINI_API_KEY")
+    jina_api_key: Optional[str] = Field(default=None, validation_alias="JINA_API_KEY")
     
     # External Service URLs & Keys
-    qdrant_mode: str = Field(default="online", env="QDRANT_MODE")  # "online" or "local"
-    qdrant_url: Optional[str] = Field(default= None, env="QDRANT_URL_ONLINE")
-    qdrant_api_key: Optional[str] = Field(default=None, env="QDRANT_API_KEY")
-    redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
+    qdrant_mode: str = Field(default="online", validation_alias="QDRANT_MODE")  # "online" or "local"
+    qdrant_url: Optional[str] = Field(default=None, validation_alias="QDRANT_URL_ONLINE")
+    qdrant_api_key: Optional[str] = Field(default=None, validation_alias="QDRANT_API_KEY")
+    redis_url: str = Field(default="redis://localhost:6379", validation_alias="REDIS_URL")
     
     # Database Configuration
-    database_provider: str = Field(default="sqlite", env="DATABASE_PROVIDER")
-    database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
+    database_provider: str = Field(default="sqlite", validation_alias="DATABASE_PROVIDER")
+    database_url: Optional[str] = Field(default=None, validation_alias="DATABASE_URL")
     
     # PostgreSQL Settings
-    postgres_host: str = Field(default="localhost", env="POSTGRES_HOST")
-    postgres_port: int = Field(default=5432, env="POSTGRES_PORT")
-    postgres_db: str = Field(default="gitmesh_rag", env="POSTGRES_DB")
-    postgres_user: str = Field(default="GitMesh", env="POSTGRES_USER")
-    postgres_password: str = Field(default="gitmeshpass", env="POSTGRES_PASSWORD")
-    postgres_ssl: str = Field(default="prefer", env="POSTGRES_SSL")
+    postgres_host: str = Field(default="localhost", validation_alias="POSTGRES_HOST")
+    postgres_port: int = Field(default=5432, validation_alias="POSTGRES_PORT")
+    postgres_db: str = Field(default="gitmesh_rag", validation_alias="POSTGRES_DB")
+    postgres_user: str = Field(default="GitMesh", validation_alias="POSTGRES_USER")
+    postgres_password: str = Field(default="gitmeshpass", validation_alias="POSTGRES_PASSWORD")
+    postgres_ssl: str = Field(default="prefer", validation_alias="POSTGRES_SSL")
     
     # Supabase Settings
-    supabase_url: Optional[str] = Field(default=None, env="SUPABASE_URL")
-    supabase_anon_key: Optional[str] = Field(default=None, env="SUPABASE_ANON_KEY")
-    supabase_service_role_key: Optional[str] = Field(default=None, env="SUPABASE_SERVICE_ROLE_KEY")
+    supabase_url: Optional[str] = Field(default=None, validation_alias="SUPABASE_URL")
+    supabase_anon_key: Optional[str] = Field(default=None, validation_alias="SUPABASE_ANON_KEY")
+    supabase_service_role_key: Optional[str] = Field(default=None, validation_alias="SUPABASE_SERVICE_ROLE_KEY")
     
     # Database Pool Settings
-    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
-    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
-    db_pool_timeout: int = Field(default=30, env="DB_POOL_TIMEOUT")
-    db_pool_recycle: int = Field(default=3600, env="DB_POOL_RECYCLE")
-    db_create_tables: bool = Field(default=True, env="DB_CREATE_TABLES")
+    db_pool_size: int = Field(default=10, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, validation_alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=3600, validation_alias="DB_POOL_RECYCLE")
+    db_create_tables: bool = Field(default=True, validation_alias="DB_CREATE_TABLES")
     
     # Security
-    secret_key: str = Field(default="your-super-secret-key-change-in-production-minimum-32-chars", env="SECRET_KEY")
-    jwt_secret: str = Field(default="your-jwt-secret-key-change-in-production-minimum-32-chars", env="JWT_SECRET")
+    secret_key: str = Field(default="your-super-secret-key-change-in-production-minimum-32-chars", validation_alias="SECRET_KEY")
+    jwt_secret: str = Field(default="your-jwt-secret-key-change-in-production-minimum-32-chars", validation_alias="JWT_SECRET")
     
     # GitHub Integration
-    github_client_id: Optional[str] = Field(default=None, env="GITHUB_CLIENT_ID")
-    github_client_secret: Optional[str] = Field(default=None, env="GITHUB_CLIENT_SECRET")
-    github_callback_url: Optional[str] = Field(default=None, env="GITHUB_CALLBACK_URL")
-    github_webhook_secret: Optional[str] = Field(default=None, env="GITHUB_WEBHOOK_SECRET")
+    github_client_id: Optional[str] = Field(default=None, validation_alias="GITHUB_CLIENT_ID")
+    github_client_secret: Optional[str] = Field(default=None, validation_alias="GITHUB_CLIENT_SECRET")
+    github_callback_url: Optional[str] = Field(default=None, validation_alias="GITHUB_CALLBACK_URL")
+    github_webhook_secret: Optional[str] = Field(default=None, validation_alias="GITHUB_WEBHOOK_SECRET")
     
     # Allowed origins for CORS and security
-    allowed_origins: Optional[str] = Field(default=None, env="ALLOWED_ORIGINS")
+    allowed_origins: Optional[str] = Field(default=None, validation_alias="ALLOWED_ORIGINS")
     
     # Observability
-    trace_file: str = Field(default="./traces.jsonl", env="TRACE_FILE")
+    trace_file: str = Field(default="./traces.jsonl", validation_alias="TRACE_FILE")
     
     # ========================
     # YAML CONFIGURATION
@@ -115,7 +116,7 @@ class Settings(BaseSettings):
     def debug(self) -> bool:
         return self.get_yaml_config("app.debug", False)
     
-    @property
+    @cached_property
     def environment(self) -> str:
         return self.get_yaml_config("app.environment", "development")
     
@@ -130,7 +131,7 @@ class Settings(BaseSettings):
     # ========================
     # AGENT CONFIGURATION (from YAML)
     # ========================
-    @property
+    @cached_property
     def agents_enabled(self) -> Dict[str, bool]:
         return {
             "code_chat": self.get_yaml_config("agents.code_chat", True),
@@ -143,7 +144,7 @@ class Settings(BaseSettings):
     # ========================
     # PROVIDER CONFIGURATION (from YAML)
     # ========================
-    @property
+    @cached_property
     def providers_enabled(self) -> Dict[str, bool]:
         return {
             "litellm": self.get_yaml_config("providers.litellm", True),
@@ -194,11 +195,27 @@ class Settings(BaseSettings):
     
     @property
     def sentence_transformers_device(self) -> str:
-        return self.get_yaml_config("embeddings.sentence_transformers.device", "cpu")
+        return self.get_yaml_config("embeddings.sentence_transformers.device", "auto")
+    
+    @property
+    def sentence_transformers_fp16(self) -> bool:
+        return self.get_yaml_config("embeddings.sentence_transformers.fp16", True)
+    
+    @property
+    def sentence_transformers_num_threads(self) -> Optional[int]:
+        return self.get_yaml_config("embeddings.sentence_transformers.num_threads", None)
     
     @property
     def sentence_transformers_batch_size(self) -> int:
-        return self.get_yaml_config("embeddings.sentence_transformers.batch_size", 32)
+        return self.get_yaml_config("embeddings.sentence_transformers.batch_size", 128)
+    
+    @property
+    def sentence_transformers_backend(self) -> str:
+        return self.get_yaml_config("embeddings.sentence_transformers.backend", "torch")
+    
+    @property
+    def sentence_transformers_onnx_provider(self) -> Optional[str]:
+        return self.get_yaml_config("embeddings.sentence_transformers.onnx_provider", None)
     
     @property
     def jina_base_url(self) -> str:
@@ -215,6 +232,22 @@ class Settings(BaseSettings):
     def max_retrieval_results(self) -> int:
         return self.get_yaml_config("vectorstore.qdrant.max_retrieval_results", 5)
     
+    @property
+    def qdrant_quantize(self) -> bool:
+        return self.get_yaml_config("vectorstore.qdrant.quantize", True)
+    
+    @property
+    def qdrant_vector_datatype(self) -> Optional[str]:
+        return self.get_yaml_config("vectorstore.qdrant.vector_datatype", "float16")
+    
+    @property
+    def qdrant_prefer_grpc(self) -> bool:
+        return self.get_yaml_config("vectorstore.qdrant.prefer_grpc", True)
+    
+    @property
+    def qdrant_grpc_port(self) -> int:
+        return self.get_yaml_config("vectorstore.qdrant.grpc_port", 6334)
+    
     # ========================
     # RAG SETTINGS (from YAML)
     # ========================
@@ -256,6 +289,18 @@ class Settings(BaseSettings):
     def redis_db(self) -> int:
         return self.get_yaml_config("cache.redis_db", 0)
     
+    @property
+    def semantic_cache_enabled(self) -> bool:
+        return self.get_yaml_config("cache.semantic.enabled", False)
+    
+    @property
+    def semantic_cache_threshold(self) -> float:
+        return self.get_yaml_config("cache.semantic.similarity_threshold", 0.97)
+    
+    @property
+    def semantic_cache_ttl(self) -> int:
+        return self.get_yaml_config("cache.semantic.ttl", 900)
+    
     # ========================
     # RATE LIMITING (from YAML)
     # ========================
@@ -325,7 +370,7 @@ class Settings(BaseSettings):
     # ========================
     # FEATURE FLAGS (from YAML)
     # ========================
-    @property
+    @cached_property
     def feature_flags(self) -> Dict[str, bool]:
         return {
             "agent_registry": self.get_yaml_config("features.agent_registry", True),
@@ -379,12 +424,12 @@ class Settings(BaseSettings):
     # QDRANT CONFIGURATION HELPERS
     # ========================
     
-    @property
+    @cached_property
     def is_qdrant_online(self) -> bool:
         """Check if Qdrant is configured for online mode."""
         return self.qdrant_mode.lower() == "online"
     
-    @property
+    @cached_property
     def is_qdrant_local(self) -> bool:
         """Check if Qdrant is configured for local mode."""
         return self.qdrant_mode.lower() == "local"
@@ -465,34 +510,33 @@ class Settings(BaseSettings):
         else:  # sqlite
             return "sqlite:///./beetle_dev.db"
     
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": False,
-        "extra": "ignore"
-    }
-
-
-# Global settings instance
-settings = Settings()
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        populate_by_name=True,
+        extra="ignore",
+        frozen=True
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance."""
-    return settings
+    return Settings()
 
 
 # Convenience functions for feature flags
 def is_agent_enabled(agent_name: str) -> bool:
     """Check if an agent is enabled."""
-    return settings.is_agent_enabled(agent_name)
+    return get_settings().is_agent_enabled(agent_name)
 
 
 def is_provider_enabled(provider_name: str) -> bool:
     """Check if a provider is enabled."""
-    return settings.is_provider_enabled(provider_name)
+    return get_settings().is_provider_enabled(provider_name)
 
 
 def is_feature_enabled(feature_name: str) -> bool:
     """Check if a feature is enabled."""
-    return settings.is_feature_enabled(feature_name)
+    return get_settings().is_feature_enabled(feature_name)
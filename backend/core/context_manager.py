@@ -1,6 +1,8 @@
 from typing import List, Dict
 import structlog
 
+from utils.text_utils import approx_token_count
+
 logger = structlog.get_logger(__name__)
 
 class ContextWindow:
@@ -11,7 +13,7 @@ class ContextWindow:
             import litellm
             self.token_counter = lambda text: litellm.token_counter(model=self.model, text=text)
         except ImportError:
-            self.token_counter = lambda text: len(text.split()) * 1.3
+            self.token_counter = lambda text: approx_token_count(text) * 1.3
 
     def count_tokens(self, messages: List[Dict]) -> int:
         text = " ".join([m.get("content", "") for m in messages])
@@ -17,7 +17,7 @@ from models.api.session_models import ChatSession, SessionContext, FileContext
 from rag.preprocessing.chunker import get_text_chunker
 from rag.retrieval.vector_retriever import get_enhanced_vector_retriever
 from rag.generation.response_generator import get_enhanced_response_generator
-from embeddings import get_embeddings_provider
+from embeddings import get_embeddings_provider, SentenceTransformersEmbeddingsProvider
 from vectorstore.qdrant.client import get_enhanced_qdrant_client
 from agents.base.base_agent import get_enhanced_agent_registry, AgentTask, AgentResult
 from utils.file_utils import detect_file_type, detect_language
@@ -43,6 +43,9 @@ class RAGOrchestrator:
         # Session manager
         self.session_manager = get_session_manager()
         
+        # Background embeddings model load started by initialize()
+        self._warm_up_task: Optional[asyncio.Task] = None
+        
         # Pipeline state
         self.processing_files: Dict[str, FileProcessingResult] = {}
         self.conversation_history: Dict[str, List[Dict[str, Any]]] = {}
@@ -58,6 +61,10 @@ class RAGOrchestrator:
                 logger.error("Failed to initialize Qdrant client")
                 return False
             
+            # Load the local model and pay its first-encode setup in the
+            # background; requests that need it before then wait for the load
+            self._warm_up_task = asyncio.create_task(self._warm_up_embeddings())
+            
             # Initialize session manager
             session_manager_initialized = await initialize_session_manager()
             if not session_manager_initialized:
@@ -79,6 +86,9 @@ class RAGOrchestrator:
         try:
             logger.info("Shutting down RAG orchestrator")
             
+            if self._warm_up_task and not self._warm_up_task.done():
+                self._warm_up_task.cancel()
+            
             # Shutdown session manager
             await shutdown_session_manager()
             
@@ -90,6 +100,16 @@ class RAGOrchestrator:
         except Exception as e:
             logger.error("Error during orchestrator shutdown", error=str(e))
     
+    async def _warm_up_embeddings(self) -> None:
+        """Run one encode through a local embeddings model."""
+        if not isinstance(self.embeddings_provider, SentenceTransformersEmbeddingsProvider):
+            return
+        try:
+            await self.embeddings_provider.embed_single("warm up")
+            logger.info("Embeddings model warmed up")
+        except Exception as e:
+            logger.warning("Embeddings warm-up failed", error=str(e))
+    
     async def _start_agents(self) -> None:
         """Start all registered agents."""
         try:
@@ -147,6 +167,7 @@ class RAGOrchestrator:
             
             # Create document chunks
             document_chunks = []
+            created_at = datetime.now()
             for i, chunk in enumerate(chunks):
                 chunk_metadata = ChunkMetadata(
                     chunk_id=f"{file_id}_{i}",
@@ -165,13 +186,16 @@ class RAGOrchestrator:
                     chunk_id=f"{file_id}_{i}",
                     file_id=file_id,
                     content=chunk.get('text', ''),
-                    metadata=chunk_metadata
+                    metadata=chunk_metadata,
+                    created_at=created_at
                 )
                 document_chunks.append(document_chunk)
             
-            # Generate embeddings
-            for chunk in document_chunks:
-                embedding = await self.embeddings_provider.embed_text(chunk.content)
+            # Generate embeddings for all chunks in a single batched call
+            embeddings = await self.embeddings_provider.embed_batch(
+                [chunk.content for chunk in document_chunks]
+            )
+            for chunk, embedding in zip(document_chunks, embeddings):
                 chunk.embedding = embedding
             
             # Store in vector database
@@ -209,33 +233,45 @@ class RAGOrchestrator:
     
     async def process_session_files(self, session_id: str, files: List[Dict[str, Any]]) -> bool:
         """Process files for a specific session."""
+        errors = await self.process_session_files_detailed(session_id, files)
+        return any(error is None for error in errors)
+    
+    async def process_session_files_detailed(
+        self, 
+        session_id: str, 
+        files: List[Dict[str, Any]]
+    ) -> List[Optional[str]]:
+        """Process files for a session, returning one error per file (None on success)."""
         try:
             session = self.session_manager.get_session(session_id)
             if not session:
                 logger.error(f"Session {session_id} not found")
-                return False
+                return [f"Session {session_id} not found"] * len(files)
             
-            processed_count = 0
+            errors: List[Optional[str]] = []
             for file_data in files:
                 try:
                     # Add file to session context
                     success = self.session_manager.add_file_to_session(session_id, file_data)
                     if success:
-                        processed_count += 1
+                        errors.append(None)
                         logger.info(f"Added file {file_data['path']} to session {session_id}")
                     else:
+                        errors.append("File could not be added to the session")
                         logger.warning(f"Failed to add file {file_data['path']} to session {session_id}")
                         
                 except Exception as e:
+                    errors.append(str(e))
                     logger.error(f"Error processing file {file_data.get('path', 'unknown')}: {str(e)}")
                     continue
             
+            processed_count = errors.count(None)
             logger.info(f"Processed {processed_count}/{len(files)} files for session {session_id}")
-            return processed_count > 0
+            return errors
             
         except Exception as e:
             logger.error(f"Error processing session files: {str(e)}")
-            return False
+            return [str(e)] * len(files)
     
     async def chat_with_session_context(
         self, 
@@ -5,7 +5,9 @@ Replaces standalone context management with session-based approach.
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, List, Set
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, Optional, List, Set
 import structlog
 from datetime import datetime, timedelta
 import uuid
@@ -27,13 +29,14 @@ class SessionManager:
         """Initialize the session manager."""
         # Session storage (in production, use Redis or database)
         self.sessions: Dict[str, ChatSession] = {}
-        self.session_messages: Dict[str, List[SessionMessage]] = {}
+        self.session_messages: Dict[str, Deque[SessionMessage]] = {}
         
         # Load configuration
         config = get_session_config()
         self.session_timeout = config.session_timeout_seconds
         self.max_sessions_per_user = config.max_sessions_per_user
         self.cleanup_interval = config.cleanup_interval_seconds
+        self.max_messages_per_session = config.max_messages_per_session
         
         # Cleanup task
         self.cleanup_task: Optional[asyncio.Task] = None
@@ -64,9 +67,11 @@ class SessionManager:
     ) -> ChatSession:
         """Create a new chat session."""
         session_id = str(uuid.uuid4())
+        # One timestamp for every created/updated/activity field
+        now = datetime.now()
         
         # Create session context
-        context = SessionContext(session_id=session_id)
+        context = SessionContext(session_id=session_id, created_at=now, updated_at=now)
         
         # Create session
         session = ChatSession(
@@ -75,12 +80,15 @@ class SessionManager:
             title=title,
             repository_id=repository_id,
             branch=branch,
-            context=context
+            context=context,
+            created_at=now,
+            updated_at=now,
+            last_activity=now
         )
         
         # Store session
         self.sessions[session_id] = session
-        self.session_messages[session_id] = []
+        self.session_messages[session_id] = deque(maxlen=self.max_messages_per_session)
         
         logger.info(f"Created session {session_id} for user {user_id}")
         return session
@@ -218,7 +226,7 @@ class SessionManager:
         
         # Add to session messages
         if session_id not in self.session_messages:
-            self.session_messages[session_id] = []
+            self.session_messages[session_id] = deque(maxlen=self.max_messages_per_session)
         
         self.session_messages[session_id].append(message)
         
@@ -234,10 +242,12 @@ class SessionManager:
         limit: Optional[int] = None
     ) -> List[SessionMessage]:
         """Get messages for a session."""
-        messages = self.session_messages.get(session_id, [])
-        if limit:
-            messages = messages[-limit:]
-        return messages
+        messages = self.session_messages.get(session_id)
+        if not messages:
+            return []
+        if limit and limit < len(messages):
+            return list(islice(messages, len(messages) - limit, None))
+        return list(messages)
     
     def get_session_stats(self, session_id: str) -> Optional[SessionStats]:
         """Get session statistics."""
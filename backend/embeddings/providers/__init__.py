@@ -38,6 +38,9 @@ class EmbeddingProviderRegistry:
         # Provider instances cache
         self._instances: Dict[str, BaseEmbeddingsProvider] = {}
         self._default_provider = None
+        
+        # Model name -> provider name, built on first lookup
+        self._model_index: Optional[Dict[str, str]] = None
     
     def register_provider(self, name: str, provider_class: Type[BaseEmbeddingsProvider]) -> None:
         """Register a new provider.
@@ -47,6 +50,7 @@ class EmbeddingProviderRegistry:
             provider_class: Provider class to register.
         """
         self._providers[name] = provider_class
+        self._model_index = None
         logger.info("Registered embedding provider", provider=name)
     
     def get_provider(self, provider_name: str = None, **kwargs) -> BaseEmbeddingsProvider:
@@ -135,15 +139,26 @@ class EmbeddingProviderRegistry:
         Returns:
             Provider name that supports the model, or None if not found.
         """
+        if self._model_index is None:
+            self._model_index = self._build_model_index()
+        return self._model_index.get(model_name)
+    
+    def _build_model_index(self) -> Dict[str, str]:
+        """Map every supported model to the first registered provider that offers it.
+        
+        Returns:
+            Dictionary mapping model names to provider names.
+        """
+        model_index: Dict[str, str] = {}
         for provider_name in self._providers:
             try:
                 provider = self.get_provider(provider_name)
-                if model_name in provider.get_supported_models():
-                    return provider_name
             except Exception:
                 continue
+            for model_name in provider.get_supported_models():
+                model_index.setdefault(model_name, provider_name)
         
-        return None
+        return model_index
     
     async def embed_texts(self, texts: List[str], provider_name: str = None, 
                          model: str = None, **kwargs) -> EmbeddingResponse:
@@ -130,18 +130,18 @@ class BaseEmbeddingsProvider(ABC):
         try:
             import numpy as np
             
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
+            # Embeddings are float32 on the wire; avoid float64 temporaries
+            vec1 = np.asarray(embedding1, dtype=np.float32)
+            vec2 = np.asarray(embedding2, dtype=np.float32)
             
             # Normalize vectors
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
+            norm_product = np.linalg.norm(vec1) * np.linalg.norm(vec2)
             
-            if norm1 == 0 or norm2 == 0:
+            if norm_product == 0:
                 return 0.0
             
             # Calculate cosine similarity
-            similarity = np.dot(vec1, vec2) / (norm1 * norm2)
+            similarity = np.dot(vec1, vec2) / norm_product
             return float(similarity)
             
         except Exception as e:
@@ -162,16 +162,23 @@ class BaseEmbeddingsProvider(ABC):
             List of tuples (index, similarity_score) sorted by similarity.
         """
         try:
-            similarities = []
-            for i, candidate in enumerate(candidate_embeddings):
-                similarity = self.calculate_similarity(query_embedding, candidate)
-                similarities.append((i, similarity))
+            import numpy as np
+            
+            if not candidate_embeddings:
+                return []
+            
+            query = np.asarray(query_embedding, dtype=np.float32)
+            candidates = np.asarray(candidate_embeddings, dtype=np.float32)
             
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
+            # Cosine similarity for all candidates at once: one vectorized row
+            # normalization and a single matrix-vector product
+            norms = np.linalg.norm(candidates, axis=1) * np.linalg.norm(query)
+            dots = candidates @ query
+            similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
             
-            # Return top-k results
-            return similarities[:top_k]
+            # Sort by similarity (descending) and return top-k results
+            order = np.argsort(-similarities, kind="stable")[:top_k]
+            return [(int(i), float(similarities[i])) for i in order]
             
         except Exception as e:
             logger.error("Most similar search failed", error=str(e))
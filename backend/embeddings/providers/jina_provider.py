@@ -7,6 +7,7 @@ import asyncio
 from typing import List, Optional, Dict, Any, Union
 import structlog
 from config.settings import get_settings
+from utils.text_utils import approx_token_count
 
 from .base_provider import BaseEmbeddingsProvider, EmbeddingRequest, EmbeddingResponse
 
@@ -206,7 +207,7 @@ class JinaEmbeddingsProvider(BaseEmbeddingsProvider):
                 return None
             
             # Count total tokens (rough estimation)
-            total_tokens = sum(len(text.split()) for text in texts)
+            total_tokens = sum(approx_token_count(text) for text in texts)
             
             # Calculate cost
             cost_per_1k = model_info["pricing"]["input"]
@@ -9,6 +9,7 @@ import litellm
 import numpy as np
 import structlog
 from config.settings import get_settings
+from utils.text_utils import approx_token_count
 
 from .base_provider import BaseEmbeddingsProvider, EmbeddingRequest, EmbeddingResponse
 
@@ -168,7 +169,7 @@ class OpenAIEmbeddingsProvider(BaseEmbeddingsProvider):
                     total_tokens += tokens
                 except:
                     # Fallback to word count estimation
-                    total_tokens += len(text.split()) * 1.3
+                    total_tokens += approx_token_count(text) * 1.3
             
             # Calculate cost
             cost_per_1k = model_info["pricing"]["input"]
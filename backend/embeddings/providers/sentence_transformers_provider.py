@@ -4,13 +4,24 @@ Handles text embedding generation with local models.
 """
 
 import asyncio
+import hashlib
+import os
+from functools import partial
 from typing import List, Optional, Dict, Any, Union
 import numpy as np
 import structlog
+from cachetools import LRUCache
 from config.settings import get_settings
 
 from .base_provider import BaseEmbeddingsProvider, EmbeddingRequest, EmbeddingResponse
 
+# xxh3 hashes long chunks several times faster than blake2b; fall back if absent
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
@@ -26,31 +37,92 @@ class SentenceTransformersEmbeddingsProvider(BaseEmbeddingsProvider):
         # Model configuration
         self.model_name = model_name or settings.default_embedding_model
         self.model = None
-        self._load_model()
+        self.backend = kwargs.get("backend", settings.sentence_transformers_backend)
+        self.onnx_provider = kwargs.get("onnx_provider", settings.sentence_transformers_onnx_provider)
+        self.device = kwargs.get("device", settings.sentence_transformers_device)
+        self.fp16 = kwargs.get("fp16", settings.sentence_transformers_fp16)
+        self.num_threads = kwargs.get("num_threads", settings.sentence_transformers_num_threads)
+        
+        # Loaded on first use (or by a startup warm-up) in a worker thread
+        self._model_lock = asyncio.Lock()
         
         # Configuration
-        self.max_batch_size = kwargs.get("max_batch_size", 32)  # GPU memory friendly
+        # Large batches let sentence-transformers' length sorting cut padding waste
+        self.max_batch_size = kwargs.get("max_batch_size", settings.sentence_transformers_batch_size)
         self.max_retries = kwargs.get("max_retries", 1)  # Local model, no retries needed
         self.retry_delay = kwargs.get("retry_delay", 0)
         
         # Model info cache
         self._model_info = None
+        
+        # Embeddings of recently seen texts, keyed by content digest
+        self._embedding_cache: LRUCache = LRUCache(maxsize=kwargs.get("embedding_cache_size", 10000))
+    
+    async def ensure_model(self) -> None:
+        """Load the model off the event loop if it isn't loaded yet."""
+        if self.model is not None:
+            return
+        async with self._model_lock:
+            if self.model is None:
+                await asyncio.get_event_loop().run_in_executor(None, self._load_model)
     
     def _load_model(self):
         """Load the sentence transformers model."""
         try:
             from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(self.model_name)
-            logger.info(f"Loaded sentence transformers model: {self.model_name}")
         except ImportError:
             raise ImportError(
                 "sentence-transformers not installed. "
                 "Install with: pip install sentence-transformers"
             )
+        
+        # Rust tokenizers parallelise batch encoding only when this is set before load
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+        
+        if self.backend != "torch":
+            model_kwargs = {"provider": self.onnx_provider} if self.backend == "onnx" and self.onnx_provider else None
+            try:
+                self.model = SentenceTransformer(self.model_name, backend=self.backend, model_kwargs=model_kwargs)
+                logger.info(f"Loaded sentence transformers model: {self.model_name}", backend=self.backend)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load {self.backend} backend for {self.model_name}, falling back to torch",
+                    error=str(e)
+                )
+                self.backend = "torch"
+        
+        import torch
+        
+        # Container defaults often leave torch using a fraction of the cores
+        torch.set_num_threads(self.num_threads or os.cpu_count() or 1)
+        try:
+            torch.set_num_interop_threads(2)
+        except RuntimeError:
+            # Can only be set once, before any inter-op work has started
+            pass
+        
+        if self.device == "auto":
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        
+        try:
+            self.model = SentenceTransformer(self.model_name, device=self.device)
+            # FP16 halves memory traffic and uses tensor cores on GPU
+            if self.fp16 and self.device.startswith("cuda"):
+                self.model.half()
+            logger.info(f"Loaded sentence transformers model: {self.model_name}", device=self.device)
         except Exception as e:
             logger.error(f"Failed to load model {self.model_name}", error=str(e))
             raise
     
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Content digest used to deduplicate texts before encoding."""
+        data = text.encode("utf-8")
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_digest(data)
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
     async def embed_texts(self, request: EmbeddingRequest) -> EmbeddingResponse:
         """Generate embeddings for a list of texts using local model."""
         if not request.texts:
@@ -61,22 +133,48 @@ class SentenceTransformersEmbeddingsProvider(BaseEmbeddingsProvider):
         model_name = self._ensure_local_model(model_name)
         
         try:
-            # Process in batches (CPU-friendly)
-            all_embeddings = []
+            # Embed each distinct text once; repeats within the request and
+            # recently embedded texts are served from the cache
+            keys = [self._cache_key(text) for text in request.texts]
+            vectors: Dict[bytes, np.ndarray] = {}
+            missing: Dict[bytes, str] = {}
+            for key, text in zip(keys, request.texts):
+                if key in vectors or key in missing:
+                    continue
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    vectors[key] = cached
+                else:
+                    missing[key] = text
             
-            for i in range(0, len(request.texts), self.max_batch_size):
-                batch_texts = request.texts[i:i + self.max_batch_size]
+            if missing:
+                await self.ensure_model()
                 
-                # Run in thread pool to avoid blocking
-                batch_embeddings = await asyncio.get_event_loop().run_in_executor(
-                    None, 
-                    self.model.encode, 
-                    batch_texts
+                # Encode all misses in one call so sentence-transformers can sort by
+                # length and batch internally; run in thread pool to avoid blocking
+                embeddings = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    partial(
+                        self.model.encode,
+                        list(missing.values()),
+                        batch_size=self.max_batch_size,
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,
+                        show_progress_bar=False,
+                    ),
                 )
-                
-                # Convert to list format
-                batch_embeddings = [embedding.tolist() for embedding in batch_embeddings]
-                all_embeddings.extend(batch_embeddings)
+                for key, embedding in zip(missing, embeddings):
+                    vectors[key] = embedding
+                    # Copy so the cached row does not keep the whole batch matrix alive
+                    self._embedding_cache[key] = embedding.copy()
+            
+            # Convert to list format: a fully fresh batch is converted in one call,
+            # otherwise each distinct vector is boxed once and shared by repeats
+            if len(missing) == len(keys):
+                all_embeddings = embeddings.tolist()
+            else:
+                boxed = {key: vector.tolist() for key, vector in vectors.items()}
+                all_embeddings = [boxed[key] for key in keys]
             
             return EmbeddingResponse(
                 embeddings=all_embeddings,
@@ -173,8 +271,7 @@ class SentenceTransformersEmbeddingsProvider(BaseEmbeddingsProvider):
     async def health_check(self) -> bool:
         """Check if local embeddings provider is healthy."""
         try:
-            if self.model is None:
-                return False
+            await self.ensure_model()
             
             # Test embedding
             embedding = await asyncio.get_event_loop().run_in_executor(
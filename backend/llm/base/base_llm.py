@@ -9,6 +9,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 import structlog
 
+from utils.text_utils import approx_token_count
+
 logger = structlog.get_logger(__name__)
 
 
@@ -110,7 +112,7 @@ class BaseLLM(ABC):
             return litellm.token_counter(model=model, text=text)
         except Exception:
             # Fallback to simple estimation
-            return len(text.split()) * 1.3
+            return approx_token_count(text) * 1.3
     
     async def estimate_cost(self, request: LLMRequest) -> Optional[float]:
         """Estimate the cost of a request using LiteLLM pricing."""
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from .base import DeferredModel
+
 # --- Aggregated Data Models ---
 
 class RepositoryReference(BaseModel):
@@ -96,7 +98,7 @@ class IssueQueryParams(AggregatedQueryParams):
     """Query parameters for aggregated issues"""
     pass
 
-class SummaryQueryParams(BaseModel):
+class SummaryQueryParams(DeferredModel):
     """Query parameters for activity summary"""
     limit: int = Field(default=10, ge=1, le=50, description="Number of repositories to analyze")
 
@@ -123,7 +125,7 @@ class ActivitySummaryResponse(BaseModel):
 
 # --- Error Models ---
 
-class AggregationError(BaseModel):
+class AggregationError(DeferredModel):
     """Error in data aggregation"""
     error: str = Field(default="Aggregation failed", description="Error type")
     message: str = Field(..., description="Error message")
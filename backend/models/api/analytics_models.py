@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
+from .base import DeferredModel
+
 # --- Base Analytics Models ---
 
 class LanguageDistribution(BaseModel):
@@ -11,13 +13,13 @@ class LanguageDistribution(BaseModel):
         description="Top 10 languages with count"
     )
 
-class RepositoryType(BaseModel):
+class RepositoryType(DeferredModel):
     forks: int = Field(default=0, description="Number of forked repositories")
     original: int = Field(default=0, description="Number of original repositories")
     private: int = Field(default=0, description="Number of private repositories")
     public: int = Field(default=0, description="Number of public repositories")
 
-class TopRepository(BaseModel):
+class TopRepository(DeferredModel):
     name: str = Field(..., description="Repository name")
     full_name: str = Field(..., description="Full repository name (owner/repo)")
     stars: int = Field(..., description="Number of stars")
@@ -209,7 +211,7 @@ class AIInsights(BaseModel):
 
 # --- Request/Response Models ---
 
-class ContributionPeriod(BaseModel):
+class ContributionPeriod(DeferredModel):
     period: Optional[str] = Field(
         "month", 
         description="Analysis period",
@@ -217,11 +219,11 @@ class ContributionPeriod(BaseModel):
     )
     username: Optional[str] = Field(None, description="Username to analyze")
 
-class RepositoryAnalyticsRequest(BaseModel):
+class RepositoryAnalyticsRequest(DeferredModel):
     owner: str = Field(..., description="Repository owner")
     repo: str = Field(..., description="Repository name")
 
-class BranchAnalyticsRequest(BaseModel):
+class BranchAnalyticsRequest(DeferredModel):
     owner: str = Field(..., description="Repository owner")
     repo: str = Field(..., description="Repository name")
     branch: str = Field(..., description="Branch name")
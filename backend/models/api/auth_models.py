@@ -4,9 +4,11 @@ Authentication and User Management Models
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from enum import Enum
 
+from .base import DeferredModel
+
 
 class UserRole(str, Enum):
     """User role enumeration."""
@@ -15,7 +17,7 @@ class UserRole(str, Enum):
     MODERATOR = "moderator"
 
 
-class GitHubUser(BaseModel):
+class GitHubUser(DeferredModel):
     """GitHub user profile model."""
     id: int = Field(..., description="GitHub user ID")
     login: str = Field(..., description="GitHub login/username")
@@ -74,7 +76,7 @@ class UserSession(BaseModel):
     is_active: bool = Field(default=True, description="Whether session is active")
 
 
-class OAuthState(BaseModel):
+class OAuthState(DeferredModel):
     """OAuth state model for security."""
     state: str = Field(..., description="OAuth state token")
     client_ip: str = Field(..., description="Client IP address")
@@ -170,25 +172,13 @@ class UserProfileResponse(BaseModel):
 
 class UserProfileUpdateRequest(BaseModel):
     """User profile update request."""
-    name: Optional[str] = Field(default=None, description="Display name")
-    bio: Optional[str] = Field(default=None, description="User bio")
+    name: Optional[str] = Field(default=None, max_length=100, description="Display name")
+    bio: Optional[str] = Field(default=None, max_length=500, description="User bio")
     location: Optional[str] = Field(default=None, description="Location")
     company: Optional[str] = Field(default=None, description="Company")
     blog: Optional[str] = Field(default=None, description="Blog URL")
     twitter_username: Optional[str] = Field(default=None, description="Twitter username")
 
-    @validator('bio')
-    def validate_bio(cls, v):
-        if v and len(v) > 500:
-            raise ValueError('Bio must be 500 characters or less')
-        return v
-
-    @validator('name')
-    def validate_name(cls, v):
-        if v and len(v) > 100:
-            raise ValueError('Name must be 100 characters or less')
-        return v
-
 
 class UserNotesResponse(BaseModel):
     """User notes response."""
@@ -0,0 +1,10 @@
+"""
+Shared base for API models.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DeferredModel(BaseModel):
+    """Base model whose validator is built on first use instead of at import."""
+    model_config = ConfigDict(defer_build=True)
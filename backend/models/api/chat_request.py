@@ -3,11 +3,17 @@ Chat request and response models for the RAG system.
 Handles message formatting, file uploads, and response structures.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from enum import Enum
 
+from .base import DeferredModel
+
+
+# Agent types a chat request may target
+AgentType = Literal["code_chat", "documentation", "general"]
+
 
 class MessageRole(str, Enum):
     """Message role enumeration."""
@@ -28,15 +34,8 @@ class FileUpload(BaseModel):
     """File upload model."""
     filename: str = Field(..., description="Name of the uploaded file")
     content_type: str = Field(..., description="MIME type of the file")
-    size: int = Field(..., description="File size in bytes")
+    size: int = Field(..., le=10 * 1024 * 1024, description="File size in bytes (max 10MB)")
     content: bytes = Field(..., description="File content as bytes")
-    
-    @validator('size')
-    def validate_file_size(cls, v):
-        max_size = 10 * 1024 * 1024  # 10MB
-        if v > max_size:
-            raise ValueError(f"File size must be less than {max_size} bytes")
-        return v
 
 
 class ChatRequest(BaseModel):
@@ -44,7 +43,7 @@ class ChatRequest(BaseModel):
     message: str = Field(..., description="User message content")
     files: Optional[List[FileUpload]] = Field(default=None, description="Uploaded files")
     conversation_id: Optional[str] = Field(default=None, description="Conversation identifier")
-    agent_type: Optional[str] = Field(default="code_chat", description="Type of agent to use")
+    agent_type: AgentType = Field(default="code_chat", description="Type of agent to use")
     stream: bool = Field(default=False, description="Whether to stream the response")
     max_tokens: Optional[int] = Field(default=1000, description="Maximum tokens in response")
     temperature: Optional[float] = Field(default=0.7, ge=0.0, le=2.0, description="Response creativity")
@@ -56,13 +55,6 @@ class ChatRequest(BaseModel):
         if len(v) > 10000:
             raise ValueError("Message too long (max 10000 characters)")
         return v.strip()
-    
-    @validator('agent_type')
-    def validate_agent_type(cls, v):
-        allowed_agents = ["code_chat", "documentation", "general"]
-        if v not in allowed_agents:
-            raise ValueError(f"Agent type must be one of {allowed_agents}")
-        return v
 
 
 class ChatResponse(BaseModel):
@@ -86,7 +78,7 @@ class StreamingChatResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
-class ConversationHistory(BaseModel):
+class ConversationHistory(DeferredModel):
     """Conversation history model."""
     conversation_id: str = Field(..., description="Unique conversation identifier")
     messages: List[ChatMessage] = Field(default_factory=list, description="List of messages in conversation")
@@ -95,7 +87,7 @@ class ConversationHistory(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Conversation metadata")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(DeferredModel):
     """Error response model."""
     error: str = Field(..., description="Error message")
     error_code: str = Field(..., description="Error code")
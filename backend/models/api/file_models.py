@@ -10,6 +10,8 @@ from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from enum import Enum
 
+from .base import DeferredModel
+
 
 class FileStatus(str, Enum):
     """File processing status enumeration."""
@@ -118,7 +120,7 @@ class FileProcessingResult(BaseModel):
     completed_at: datetime = Field(default_factory=datetime.now, description="Processing completion timestamp")
 
 
-class FileUploadRequest(BaseModel):
+class FileUploadRequest(DeferredModel):
     """File upload request model."""
     files: List[FileMetadata] = Field(..., description="Files to upload")
     conversation_id: Optional[str] = Field(default=None, description="Associated conversation")
@@ -136,7 +138,7 @@ class FileUploadResponse(BaseModel):
     successful_uploads: int = Field(..., description="Number of successful uploads")
 
 
-class FileSearchRequest(BaseModel):
+class FileSearchRequest(DeferredModel):
     """File search request model."""
     query: str = Field(..., description="Search query")
     file_ids: Optional[List[str]] = Field(default=None, description="Limit search to specific files")
@@ -7,6 +7,8 @@ from typing import Optional, Dict, Any, List, Union
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
+from .base import DeferredModel
+
 
 class GitHubUserProfile(BaseModel):
     """GitHub user profile model."""
@@ -233,7 +235,7 @@ class GitHubFileContent(BaseModel):
 
 # Search Models
 
-class SearchRepositoriesRequest(BaseModel):
+class SearchRepositoriesRequest(DeferredModel):
     """Search repositories request."""
     q: str = Field(..., description="Search query")
     sort: str = Field(default="stars", description="Sort field")
@@ -242,7 +244,7 @@ class SearchRepositoriesRequest(BaseModel):
     per_page: int = Field(default=30, ge=1, le=100, description="Items per page")
 
 
-class SearchUsersRequest(BaseModel):
+class SearchUsersRequest(DeferredModel):
     """Search users request."""
     q: str = Field(..., description="Search query")
     sort: str = Field(default="followers", description="Sort field")
@@ -251,7 +253,7 @@ class SearchUsersRequest(BaseModel):
     per_page: int = Field(default=30, ge=1, le=100, description="Items per page")
 
 
-class SearchOrganizationsRequest(BaseModel):
+class SearchOrganizationsRequest(DeferredModel):
     """Search organizations request."""
     q: str = Field(..., description="Search query")
     sort: str = Field(default="repositories", description="Sort field")
@@ -271,7 +273,7 @@ class SearchResponse(BaseModel):
 
 # Repository Analytics Models
 
-class RepositoryStats(BaseModel):
+class RepositoryStats(DeferredModel):
     """Repository statistics model."""
     repository: GitHubRepository = Field(..., description="Repository details")
     summary: Dict[str, Any] = Field(..., description="Summary statistics")
@@ -283,7 +285,7 @@ class RepositoryStats(BaseModel):
     languages: Dict[str, int] = Field(..., description="Language statistics")
 
 
-class BranchStats(BaseModel):
+class BranchStats(DeferredModel):
     """Branch statistics model."""
     branch: GitHubBranch = Field(..., description="Branch details")
     commits: List[GitHubCommit] = Field(..., description="Branch commits")
@@ -292,7 +294,7 @@ class BranchStats(BaseModel):
     summary: Dict[str, Any] = Field(..., description="Branch summary")
 
 
-class DashboardStats(BaseModel):
+class DashboardStats(DeferredModel):
     """Dashboard statistics model."""
     total_repositories: int = Field(..., description="Total repositories")
     total_stars: int = Field(..., description="Total stars")
@@ -304,7 +306,7 @@ class DashboardStats(BaseModel):
     languages: Dict[str, int] = Field(..., description="Language distribution")
 
 
-class TrendingRepositoriesRequest(BaseModel):
+class TrendingRepositoriesRequest(DeferredModel):
     """Trending repositories request."""
     since: str = Field(default="weekly", description="Time period")
     language: Optional[str] = Field(default=None, description="Programming language")
@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from uuid import uuid4
 
+from .base import DeferredModel
+
 # --- Base Project Models ---
 
 class ProjectSettings(BaseModel):
@@ -196,11 +198,11 @@ class BeetleProjectResponse(BaseModel):
 
 # --- Validation Models ---
 
-class ProjectIdValidation(BaseModel):
+class ProjectIdValidation(DeferredModel):
     """Project ID validation"""
     project_id: str = Field(..., description="Project ID")
 
-class BranchValidation(BaseModel):
+class BranchValidation(DeferredModel):
     """Branch validation"""
     branch: str = Field(..., description="Branch name")
 
@@ -211,7 +213,7 @@ class ProjectNotFoundError(BaseModel):
     error: str = Field(default="Project not found", description="Error type")
     message: str = Field(..., description="Error message")
 
-class ValidationError(BaseModel):
+class ValidationError(DeferredModel):
     """Validation error model"""
     error: str = Field(default="Validation Error", description="Error type")
     details: List[Dict[str, Any]] = Field(..., description="Validation error details")
@@ -7,6 +7,7 @@ from typing import List, Optional, Dict, Any, Set
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from enum import Enum
+import sys
 import uuid
 
 
@@ -137,8 +138,7 @@ class ChatSession(BaseModel):
     
     def update_activity(self) -> None:
         """Update last activity timestamp."""
-        self.last_activity = datetime.now()
-        self.updated_at = datetime.now()
+        self.last_activity = self.updated_at = datetime.now()
     
     def add_message(self) -> None:
         """Increment message count."""
@@ -177,6 +177,11 @@ class SessionMessage(BaseModel):
         if not v:
             return str(uuid.uuid4())
         return v
+    
+    @validator('session_id', 'role')
+    def intern_repeated(cls, v):
+        # Shared by every message in a session; keep one copy of each
+        return sys.intern(v)
 
 
 class SessionStats(BaseModel):
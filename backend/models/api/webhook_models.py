@@ -2,9 +2,11 @@ from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from .base import DeferredModel
+
 # --- Webhook Event Models ---
 
-class WebhookHeaders(BaseModel):
+class WebhookHeaders(DeferredModel):
     """GitHub webhook headers"""
     github_event: str = Field(..., alias="X-GitHub-Event", description="GitHub event type")
     github_delivery: str = Field(..., alias="X-GitHub-Delivery", description="Unique delivery ID")
@@ -78,14 +80,14 @@ class WebhookSecurityLog(BaseModel):
 
 # --- Webhook Configuration Models ---
 
-class WebhookConfig(BaseModel):
+class WebhookConfig(DeferredModel):
     """Webhook configuration"""
     url: str = Field(..., description="Webhook URL")
     content_type: str = Field(default="application/json", description="Content type")
     secret: Optional[str] = Field(None, description="Webhook secret")
     insecure_ssl: bool = Field(default=False, description="Allow insecure SSL")
 
-class WebhookEventConfig(BaseModel):
+class WebhookEventConfig(DeferredModel):
     """Webhook event configuration"""
     events: List[str] = Field(..., description="List of events to listen for")
     active: bool = Field(default=True, description="Whether webhook is active")
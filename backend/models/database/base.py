@@ -3,6 +3,7 @@ Base database model and utilities.
 Provides common functionality for all database models.
 """
 
+import json
 import uuid
 from datetime import datetime
 from typing import Any, Dict
@@ -12,6 +13,13 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.types import TypeDecorator, TEXT
 
+# orjson encodes and parses several times faster than the stdlib; fall back if absent
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Create the declarative base
 Base = declarative_base()
 
@@ -51,13 +59,16 @@ class JSON(TypeDecorator):
 
     def process_bind_param(self, value, dialect):
         if value is not None:
-            import json
+            if ORJSON_AVAILABLE:
+                # json.dumps accepted non-str dict keys; keep the stored format compatible
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
             return json.dumps(value)
         return value
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            import json
+            if ORJSON_AVAILABLE:
+                return orjson.loads(value)
             return json.loads(value)
         return value
 
@@ -68,6 +79,16 @@ class BaseModel:
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Pydantic field name -> mapped attribute, for names reserved by declarative (e.g. metadata)
+    _field_aliases: Dict[str, str] = {}
+
+    @classmethod
+    def _to_attribute_names(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Rename aliased Pydantic field names to their mapped attributes."""
+        if not cls._field_aliases:
+            return data
+        return {cls._field_aliases.get(k, k): v for k, v in data.items()}
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         result = {}
@@ -79,18 +100,20 @@ class BaseModel:
                 result[column.name] = str(value)
             else:
                 result[column.name] = value
+        for field_name, attribute in self._field_aliases.items():
+            result[field_name] = result.pop(attribute, None)
         return result
 
     def update_from_dict(self, data: Dict[str, Any]):
         """Update model from dictionary."""
-        for key, value in data.items():
+        for key, value in self._to_attribute_names(data).items():
             if hasattr(self, key):
                 setattr(self, key, value)
 
     @classmethod
     def from_pydantic(cls, pydantic_model):
         """Create database model from Pydantic model."""
-        data = pydantic_model.dict()
+        data = cls._to_attribute_names(pydantic_model.dict())
         # Remove fields that don't exist in the database model
         filtered_data = {k: v for k, v in data.items() if hasattr(cls, k)}
         return cls(**filtered_data)
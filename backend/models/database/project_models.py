@@ -3,7 +3,7 @@ Project-related database models.
 Maps your existing project_models.py Pydantic models to SQLAlchemy.
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from .base import Base, BaseModel, JSON, GUID
@@ -11,6 +11,10 @@ from .base import Base, BaseModel, JSON, GUID
 class ProjectModel(Base, BaseModel):
     """Project database model mapping to project_models.Project."""
     __tablename__ = "projects"
+    __table_args__ = (
+        # get_user_projects filters by creator and orders by recency
+        Index("ix_projects_created_by_updated_at", "created_by", "updated_at"),
+    )
 
     # Basic project info
     name = Column(String(100), nullable=False)
@@ -42,7 +46,7 @@ class ProjectBranchModel(Base, BaseModel):
     """Project branch database model mapping to project_models.ProjectBranch."""
     __tablename__ = "project_branches"
 
-    project_id = Column(GUID(), ForeignKey("projects.id"), nullable=False)
+    project_id = Column(GUID(), ForeignKey("projects.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     protected = Column(Boolean, default=False)
     last_commit = Column(JSON)  # Optional[Dict[str, Any]]
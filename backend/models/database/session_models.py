@@ -3,7 +3,7 @@ Session-related database models.
 Maps your existing session_models.py Pydantic models to SQLAlchemy.
 """
 
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -12,6 +12,10 @@ from .base import Base, BaseModel, JSON, GUID
 class ChatSessionModel(Base, BaseModel):
     """Chat session database model mapping to session_models.ChatSession."""
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # get_user_chat_sessions filters by user and orders by last activity
+        Index("ix_chat_sessions_user_id_last_activity", "user_id", "last_activity"),
+    )
 
     session_id = Column(String(255), unique=True, nullable=False, index=True)
     user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
@@ -39,7 +43,7 @@ class SessionMessageModel(Base, BaseModel):
     __tablename__ = "session_messages"
 
     message_id = Column(String(255), unique=True, nullable=False, index=True)
-    session_id = Column(GUID(), ForeignKey("chat_sessions.id"), nullable=False)
+    session_id = Column(GUID(), ForeignKey("chat_sessions.id"), nullable=False, index=True)
     
     # Message content
     role = Column(String(20), nullable=False)  # user, assistant, system
@@ -51,6 +55,9 @@ class SessionMessageModel(Base, BaseModel):
     code_snippets = Column(JSON, default=list)  # List[Dict[str, Any]]
     meta_data = Column(JSON)  # Optional[Dict[str, Any]]
     
+    # Declarative reserves `metadata`, so the API field maps onto meta_data
+    _field_aliases = {"metadata": "meta_data"}
+    
     # Relationships
     session = relationship("ChatSessionModel", back_populates="messages")
 
@@ -58,7 +65,7 @@ class FileContextModel(Base, BaseModel):
     """File context database model mapping to session_models.FileContext."""
     __tablename__ = "file_contexts"
 
-    session_id = Column(GUID(), ForeignKey("chat_sessions.id"), nullable=False)
+    session_id = Column(GUID(), ForeignKey("chat_sessions.id"), nullable=False, index=True)
     
     # File identification
     path = Column(Text, nullable=False)
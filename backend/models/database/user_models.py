@@ -51,7 +51,7 @@ class UserSessionModel(Base, BaseModel):
     __tablename__ = "user_sessions"
 
     session_id = Column(String(255), unique=True, nullable=False, index=True)
-    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False, index=True)
     github_id = Column(Integer, nullable=False)
     
     # Session data
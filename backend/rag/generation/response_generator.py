@@ -8,12 +8,14 @@ import structlog
 import json
 import re
 from datetime import datetime
+from cachetools import LRUCache
 from pydantic import BaseModel, Field
 
 from llm.base.base_llm import LLMRequest, LLMResponse, LLMStreamChunk
 from llm.providers.litellm_provider import LiteLLMProvider
 from rag.retrieval.vector_retriever import get_enhanced_vector_retriever
 from config.settings import get_settings
+from utils.caching import make_cache_key
 from utils.prompt_loader import render_prompt, render_prompt_with_fallback
 import instructor
 
@@ -21,6 +23,20 @@ logger = structlog.get_logger(__name__)
 settings = get_settings()
 
 
+_FILE_EXTENSIONS = r"(?:py|js|java|cpp|c|ts|jsx|tsx|html|css|json|yaml|yml|md|txt)"
+
+# File reference patterns combined into one alternation so the query is scanned
+# once and matches come back in positional order.
+_FILE_REFERENCE_RE = re.compile(
+    "|".join([
+        r"file[:\s]+([^\s]+)",
+        rf"in\s+([^/\s]+\.{_FILE_EXTENSIONS})",
+        rf"([^/\s]+\.{_FILE_EXTENSIONS})",
+    ]),
+    re.IGNORECASE,
+)
+
+
 # Enhanced Pydantic models for query classification and response generation
 class QueryClassification(BaseModel):
     """Query classification result."""
@@ -110,8 +126,9 @@ class EnhancedResponseGenerator:
         self.vector_retriever = get_enhanced_vector_retriever()
         self.default_model = settings.default_llm_model
         
-        # Query classification cache
-        self._classification_cache: Dict[str, QueryClassification] = {}
+        # Query classification cache; repeat queries skip the LLM call and
+        # the least recently used entries are evicted once full
+        self._classification_cache: LRUCache = LRUCache(maxsize=1024)
     
     def _setup_instructor_if_needed(self):
         """Setup Instructor client only for supported models."""
@@ -253,9 +270,8 @@ class EnhancedResponseGenerator:
                 # Extract JSON from response
                 json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
                 if json_match:
-                    json_str = json_match.group()
-                    data = json.loads(json_str)
-                    return response_model(**data)
+                    # Parse and validate in one pass inside pydantic-core
+                    return response_model.model_validate_json(json_match.group())
                 else:
                     # If no JSON found, create default response
                     return self._create_default_response(response_model, response.content)
@@ -384,7 +400,7 @@ class EnhancedResponseGenerator:
         """Classify user query to determine intent and appropriate response style."""
         try:
             # Check cache first
-            cache_key = f"{query}_{hash(str(conversation_history))}_{hash(str(context_files))}"
+            cache_key = make_cache_key(query, conversation_history, context_files)
             if cache_key in self._classification_cache:
                 return self._classification_cache[cache_key]
             
@@ -746,24 +762,13 @@ class EnhancedResponseGenerator:
     async def _get_file_specific_context(self, query: str, context_files: List[str]) -> List[Dict[str, Any]]:
         """Get context specifically for files mentioned in the query."""
         try:
-            # Extract file references from query
-            import re
-            file_patterns = [
-                r'file[:\s]+([^\s]+)',
-                r'([^/\s]+\.(py|js|java|cpp|c|ts|jsx|tsx|html|css|json|yaml|yml|md|txt))',
-                r'in\s+([^/\s]+\.(py|js|java|cpp|c|ts|jsx|tsx|html|css|json|yaml|yml|md|txt))',
-                r'([a-zA-Z_][a-zA-Z0-9_]*\.(py|js|java|cpp|c|ts|jsx|tsx|html|css|json|yaml|yml|md|txt))'
+            # Extract file references from query in a single pass; each
+            # alternative has exactly one capture group holding the file name.
+            mentioned_files = [
+                match.group(match.lastindex)
+                for match in _FILE_REFERENCE_RE.finditer(query)
             ]
             
-            mentioned_files = []
-            for pattern in file_patterns:
-                matches = re.findall(pattern, query, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        mentioned_files.extend([f for f in match if f])
-                    else:
-                        mentioned_files.append(match)
-            
             # Get context for mentioned files
             context_chunks = []
             for file_path in mentioned_files:
@@ -1229,10 +1234,13 @@ When responding:
             return False
 
 
-# Global enhanced response generator instance
-enhanced_response_generator = EnhancedResponseGenerator()
+# Global enhanced response generator instance (built on first use)
+_enhanced_response_generator: Optional[EnhancedResponseGenerator] = None
 
 
 def get_enhanced_response_generator() -> EnhancedResponseGenerator:
     """Get the global enhanced response generator instance."""
-    return enhanced_response_generator
+    global _enhanced_response_generator
+    if _enhanced_response_generator is None:
+        _enhanced_response_generator = EnhancedResponseGenerator()
+    return _enhanced_response_generator
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 
 from chonkie import (
     TokenChunker,
@@ -20,6 +20,15 @@ from chonkie import (
 from chonkie.types import Chunk as ChonkieChunk
 
 from models.api.file_models import DocumentChunk, ChunkMetadata, FileType
+from utils.text_utils import approx_token_count
+
+# Inputs shorter than this (commit messages, issue comments, stubs) always fit
+# in a single chunk, so size-bounded strategies bypass the Chonkie backend.
+SMALL_INPUT_CHARS = 200
+
+# Strategies whose output depends only on size limits: any input within
+# chunk_size tokens comes back as a single chunk.
+SIZE_BOUNDED_STRATEGIES = frozenset({"token", "sentence", "recursive", "code"})
 
 
 # --------------------------------------------------------------------------- #
@@ -114,68 +123,95 @@ class TextChunker:
         Chunk the incoming text/code and return a list of DocumentChunk objects
         compatible with the rest of your codebase.
         """
-        if not text.strip():
+        if not text or text.isspace():
             return []
         
         # Allow runtime language override for code files
         if file_type == FileType.CODE and language:
             self.language = language
 
-        # Let Chonkie do the heavy lifting
-        chonkie_chunks: List[ChonkieChunk] = self._chunker.chunk(text)
+        # Inputs that fit in one chunk skip tokenisation and strategy dispatch
+        if self._fits_single_chunk(text):
+            chonkie_chunks: List[ChonkieChunk] = [
+                ChonkieChunk(
+                    text=text,
+                    start_index=0,
+                    end_index=len(text),
+                    token_count=approx_token_count(text),
+                )
+            ]
+        else:
+            # Let Chonkie do the heavy lifting
+            chonkie_chunks = self._chunker.chunk(text)
+
+        # Per-document metadata is resolved once and shared by every chunk
+        chunk_language = language or self.language
+        shared_metadata = {
+            "file_id": file_id,
+            "language": chunk_language if file_type == FileType.CODE else None,
+            "filename": filename,
+            "created_at": datetime.now(),
+        }
 
         # Map Chonkie chunks -> your DocumentChunk
         return [
-            self._to_document_chunk(
-                c,
-                file_id=file_id,
-                chunk_index=idx,
-                file_type=file_type,
-                language=language or self.language,
-                filename=filename,
-            )
+            self._to_document_chunk(c, chunk_index=idx, shared_metadata=shared_metadata)
             for idx, c in enumerate(chonkie_chunks)
         ]
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
+    def _fits_single_chunk(self, text: str) -> bool:
+        """
+        Whether `text` is known to come back as exactly one chunk, decided
+        without running the tokenizer. Semantic and late chunking may split
+        even short text by topic, so they always go through Chonkie.
+        """
+        if self.strategy not in SIZE_BOUNDED_STRATEGIES:
+            return False
+
+        # ASCII text never has more tokens than characters
+        if text.isascii():
+            return len(text) <= self.chunk_size
+
+        # Byte-level BPE spends at most one token per UTF-8 byte, so other
+        # characters (CJK, emoji) can cost up to four tokens each
+        return len(text) < min(SMALL_INPUT_CHARS, self.chunk_size // 4)
+
     def _to_document_chunk(
         self,
         chonkie_chunk: ChonkieChunk,
         *,
-        file_id: str,
         chunk_index: int,
-        file_type: FileType,
-        language: Optional[str],
-        filename: Optional[str],
+        shared_metadata: Dict[str, Any],
     ) -> DocumentChunk:
         """
         Convert a Chonkie Chunk into your internal DocumentChunk model.
+
+        ``shared_metadata`` holds the per-document fields (file_id, language,
+        filename, created_at) computed once in `chunk_text`.
         """
         chunk_id = str(uuid.uuid4())[:16]  # 128-bit → 16 hex chars
 
         metadata = ChunkMetadata(
             chunk_id=chunk_id,
-            file_id=file_id,
             chunk_index=chunk_index,
             start_line=getattr(chonkie_chunk, "start_line", None),
             end_line=getattr(chonkie_chunk, "end_line", None),
             start_char=getattr(chonkie_chunk, "start_index", 0),
             end_char=getattr(chonkie_chunk, "end_index", len(chonkie_chunk.text)),
             chunk_type=getattr(chonkie_chunk, "type", None),
-            language=language if file_type == FileType.CODE else None,
             complexity_score=None,  # Could plug in radon/mccabe here
-            created_at=datetime.now(),
-            filename=filename,
+            **shared_metadata,
         )
 
         return DocumentChunk(
             chunk_id=chunk_id,
-            file_id=file_id,
+            file_id=shared_metadata["file_id"],
             content=chonkie_chunk.text,
             metadata=metadata,
-            created_at=datetime.now(),
+            created_at=shared_metadata["created_at"],
         )
 
 
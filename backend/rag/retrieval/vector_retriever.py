@@ -4,6 +4,7 @@ Handles semantic search, result ranking, and context retrieval with Chonkie + Fa
 """
 
 from typing import List, Optional, Dict, Any, Tuple
+import re
 import structlog
 from datetime import datetime
 import numpy as np
@@ -14,6 +15,19 @@ from models.api.file_models import FileSearchResult, FileSearchResponse
 
 logger = structlog.get_logger(__name__)
 
+# Sentence bodies between terminal punctuation
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+# Characters of each chunk shown in grouped search results
+CONTENT_PREVIEW_LEN = 200
+
+
+def _preview(text: str) -> str:
+    """Truncate chunk content for display, marking cut text with an ellipsis."""
+    if len(text) <= CONTENT_PREVIEW_LEN:
+        return text
+    return f"{text[:CONTENT_PREVIEW_LEN]}..."
+
 
 class EnhancedVectorRetriever:
     """Enhanced vector-based document retrieval system with Chonkie + FastEmbed."""
@@ -93,15 +107,11 @@ class EnhancedVectorRetriever:
     ) -> List[List[Dict[str, Any]]]:
         """Batch retrieve relevant chunks for multiple queries."""
         try:
-            # Generate embeddings for all queries
-            query_embeddings = []
-            for query in queries:
-                if self._use_fastembed:
-                    embeddings = await self.qdrant_client.generate_embeddings_with_fastembed([query])
-                    query_embeddings.append(embeddings[0] if embeddings else None)
-                else:
-                    embedding = await self.embeddings_provider.embed_single(query)
-                    query_embeddings.append(embedding)
+            # Generate embeddings for all queries in a single batched call
+            if self._use_fastembed:
+                query_embeddings = await self.qdrant_client.generate_embeddings_with_fastembed(queries)
+            else:
+                query_embeddings = await self.embeddings_provider.embed_batch(queries)
             
             # Filter out None embeddings
             valid_embeddings = [(idx, emb) for idx, emb in enumerate(query_embeddings) if emb]
@@ -147,12 +157,18 @@ class EnhancedVectorRetriever:
                 payload = result.get("payload", {})
                 content = payload.get("content", "")
                 
+                # Term overlap is shared by the score and the result metadata
+                overlap_ratio = (
+                    len(query_terms.intersection(content.lower().split())) / len(query_terms)
+                    if query_terms else 0
+                )
+                
                 # Enhanced scoring
                 enhanced_score = await self._calculate_enhanced_score(
                     result["score"], 
                     content, 
                     query, 
-                    query_terms,
+                    overlap_ratio,
                     payload
                 )
                 
@@ -185,7 +201,7 @@ class EnhancedVectorRetriever:
                         enhanced_score, payload, query
                     ),
                     "metadata": {
-                        "query_overlap": len(query_terms.intersection(set(content.lower().split()))) / len(query_terms) if query_terms else 0,
+                        "query_overlap": overlap_ratio,
                         "content_length": len(content),
                         "position_in_file": payload.get("chunk_index", 0)
                     }
@@ -207,7 +223,7 @@ class EnhancedVectorRetriever:
         original_score: float,
         content: str,
         query: str,
-        query_terms: set,
+        overlap_ratio: float,
         payload: Dict[str, Any]
     ) -> float:
         """Calculate enhanced relevance score."""
@@ -224,8 +240,6 @@ class EnhancedVectorRetriever:
                 enhanced_score += 0.05
             
             # Query overlap bonus
-            content_terms = set(content.lower().split())
-            overlap_ratio = len(query_terms.intersection(content_terms)) / len(query_terms) if query_terms else 0
             enhanced_score += overlap_ratio * 0.1
             
             # Complexity score bonus (if available)
@@ -257,46 +271,53 @@ class EnhancedVectorRetriever:
         """Extract smart query highlights with context."""
         highlights = []
         query_terms = query.lower().split()
+        if not query_terms:
+            return highlights
         
-        # Split content into sentences for better context
-        import re
-        sentences = re.split(r'[.!?]+', content)
+        # Longest terms first so overlapping terms bold the widest match
+        term_pattern = re.compile(
+            "|".join(re.escape(term) for term in sorted(set(query_terms), key=len, reverse=True)),
+            re.IGNORECASE
+        )
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
+        # Walk sentence spans by offset and only materialize the sentences
+        # that actually contain a query term
+        for match in _SENTENCE_RE.finditer(content):
+            if not term_pattern.search(content, match.start(), match.end()):
                 continue
-                
+            
+            sentence = match.group().strip()
             sentence_lower = sentence.lower()
-            if any(term in sentence_lower for term in query_terms):
-                # Find query term positions
-                term_positions = []
-                for term in query_terms:
-                    pos = sentence_lower.find(term)
-                    if pos != -1:
-                        term_positions.append((pos, pos + len(term)))
+            
+            # Find query term positions
+            term_positions = []
+            for term in query_terms:
+                pos = sentence_lower.find(term)
+                if pos != -1:
+                    term_positions.append((pos, pos + len(term)))
+            
+            if term_positions:
+                # Build highlight with context
+                start_pos = max(0, min(pos[0] for pos in term_positions) - context_chars)
+                end_pos = min(len(sentence), max(pos[1] for pos in term_positions) + context_chars)
                 
-                if term_positions:
-                    # Build highlight with context
-                    start_pos = max(0, min(pos[0] for pos in term_positions) - context_chars)
-                    end_pos = min(len(sentence), max(pos[1] for pos in term_positions) + context_chars)
-                    
-                    highlight = sentence[start_pos:end_pos].strip()
-                    
-                    # Add ellipsis if truncated
-                    if start_pos > 0:
-                        highlight = "..." + highlight
-                    if end_pos < len(sentence):
-                        highlight = highlight + "..."
-                    
-                    # Bold the query terms
-                    for term in query_terms:
-                        highlight = highlight.replace(term, f"**{term}**", flags=re.IGNORECASE)
-                    
-                    if len(highlight) > 20:  # Minimum meaningful length
-                        highlights.append(highlight)
+                highlight = sentence[start_pos:end_pos].strip()
+                
+                # Add ellipsis if truncated
+                if start_pos > 0:
+                    highlight = "..." + highlight
+                if end_pos < len(sentence):
+                    highlight = highlight + "..."
+                
+                # Bold the query terms
+                highlight = term_pattern.sub(lambda m: f"**{m.group(0)}**", highlight)
+                
+                if len(highlight) > 20:  # Minimum meaningful length
+                    highlights.append(highlight)
+                    if len(highlights) >= max_highlights:
+                        break
         
-        return highlights[:max_highlights]
+        return highlights
     
     async def _generate_enhanced_explanation(
         self,
@@ -378,42 +399,31 @@ class EnhancedVectorRetriever:
             )
             
             # Group by file for better organization
-            file_groups = {}
+            file_groups: Dict[str, List[Dict[str, Any]]] = {}
             for chunk in chunks:
-                file_id = chunk["file_id"]
-                if file_id not in file_groups:
-                    file_groups[file_id] = {
-                        "chunks": [],
-                        "filename": chunk["filename"],
-                        "total_score": 0.0,
-                        "chunk_count": 0
-                    }
-                
-                file_groups[file_id]["chunks"].append(chunk)
-                file_groups[file_id]["total_score"] += chunk["enhanced_score"]
-                file_groups[file_id]["chunk_count"] += 1
+                file_groups.setdefault(chunk["file_id"], []).append(chunk)
             
             # Create results
             results = []
-            for file_id, group in file_groups.items():
-                # Average score for the file
-                avg_score = group["total_score"] / group["chunk_count"]
+            for file_id, file_chunks in file_groups.items():
+                # Average score for the file, reduced once per group
+                chunk_count = len(file_chunks)
+                avg_score = sum(c["enhanced_score"] for c in file_chunks) / chunk_count
                 
                 # Combine chunks for this file
-                combined_content = "\n\n".join([c["content"][:200] + "..." if len(c["content"]) > 200 else c["content"] 
-                                              for c in group["chunks"]])
+                combined_content = "\n\n".join([_preview(c["content"]) for c in file_chunks])
                 
                 result = FileSearchResult(
-                    chunk_id=group["chunks"][0]["chunk_id"],  # Use first chunk
+                    chunk_id=file_chunks[0]["chunk_id"],  # Use first chunk
                     file_id=file_id,
-                    filename=group["filename"],
+                    filename=file_chunks[0]["filename"],
                     content=combined_content,
                     similarity_score=avg_score,
                     metadata={
-                        "chunk_count": group["chunk_count"],
-                        "chunks": group["chunks"]
+                        "chunk_count": chunk_count,
+                        "chunks": file_chunks
                     },
-                    highlights=[h for chunk in group["chunks"] for h in chunk["highlights"][:2]]
+                    highlights=[h for chunk in file_chunks for h in chunk["highlights"][:2]]
                 )
                 results.append(result)
             
@@ -573,10 +583,13 @@ class EnhancedVectorRetriever:
             return False
 
 
-# Global enhanced vector retriever instance
-enhanced_vector_retriever = EnhancedVectorRetriever()
+# Global enhanced vector retriever instance (built on first use)
+_enhanced_vector_retriever: Optional[EnhancedVectorRetriever] = None
 
 
 def get_enhanced_vector_retriever() -> EnhancedVectorRetriever:
     """Get the global enhanced vector retriever instance."""
-    return enhanced_vector_retriever
+    global _enhanced_vector_retriever
+    if _enhanced_vector_retriever is None:
+        _enhanced_vector_retriever = EnhancedVectorRetriever()
+    return _enhanced_vector_retriever
@@ -4,10 +4,9 @@ Acts as a bridge between your existing code and the new database layer.
 """
 
 from typing import Optional, List, Dict, Any, Union
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy import select, insert, update, delete, func, bindparam, and_, or_, desc, asc
 
 from config.database import get_database_manager, get_async_db_session
 from models.database import (
@@ -24,6 +23,18 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Hot single-row lookups are built once; each call only supplies bind values
+_GET_USER_BY_GITHUB_ID = select(UserModel).where(UserModel.github_id == bindparam("github_id"))
+_GET_USER_BY_ID = select(UserModel).where(UserModel.id == bindparam("user_id"))
+_GET_USER_SESSION = select(UserSessionModel).where(UserSessionModel.session_id == bindparam("session_id"))
+_GET_PROJECT = select(ProjectModel).where(ProjectModel.id == bindparam("project_id"))
+_GET_CHAT_SESSION = select(ChatSessionModel).where(ChatSessionModel.session_id == bindparam("session_id"))
+
+def _column_values(model, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the updates that map onto table columns of the model."""
+    columns = model.__table__.columns
+    return {key: value for key, value in updates.items() if key in columns}
+
 class DatabaseService:
     """High-level database service providing CRUD operations."""
     
@@ -39,7 +50,7 @@ class DatabaseService:
         async with self.db_manager.get_async_session() as session:
             # Check if user already exists by github_id
             existing_user = await session.execute(
-                select(UserModel).where(UserModel.github_id == user_data.get('github_id'))
+                _GET_USER_BY_GITHUB_ID, {"github_id": user_data.get('github_id')}
             )
             if existing_user.scalar_one_or_none():
                 raise ValueError("User already exists")
@@ -57,34 +68,35 @@ class DatabaseService:
     
     async def get_user_by_github_id(self, github_id: int) -> Optional[User]:
         """Get user by GitHub ID."""
-        async with self.db_manager.get_async_session() as session:
-            result = await session.execute(
-                select(UserModel).where(UserModel.github_id == github_id)
-            )
+        async with self.db_manager.get_read_session() as session:
+            result = await session.execute(_GET_USER_BY_GITHUB_ID, {"github_id": github_id})
             user = result.scalar_one_or_none()
             return user.to_pydantic(User) if user else None
     
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
-        async with self.db_manager.get_async_session() as session:
-            result = await session.execute(
-                select(UserModel).where(UserModel.id == user_id)
-            )
+        async with self.db_manager.get_read_session() as session:
+            result = await session.execute(_GET_USER_BY_ID, {"user_id": user_id})
             user = result.scalar_one_or_none()
             return user.to_pydantic(User) if user else None
     
     async def update_user(self, user_id: str, updates: Dict[str, Any]) -> Optional[User]:
         """Update user data."""
+        values = _column_values(UserModel, updates)
+        if not values:
+            return await self.get_user_by_id(user_id)
+        
         async with self.db_manager.get_async_session() as session:
+            # One UPDATE ... RETURNING round trip instead of load, mutate, flush
             result = await session.execute(
-                select(UserModel).where(UserModel.id == user_id)
+                update(UserModel)
+                .where(UserModel.id == user_id)
+                .values(**values)
+                .returning(UserModel)
+                .execution_options(synchronize_session=False)
             )
             user = result.scalar_one_or_none()
-            if not user:
-                return None
-            
-            user.update_from_dict(updates)
-            return user.to_pydantic(User)
+            return user.to_pydantic(User) if user else None
     
     # ========================
     # SESSION OPERATIONS
@@ -100,24 +112,19 @@ class DatabaseService:
     
     async def get_user_session(self, session_id: str) -> Optional[UserSession]:
         """Get user session by session ID."""
-        async with self.db_manager.get_async_session() as session:
-            result = await session.execute(
-                select(UserSessionModel).where(UserSessionModel.session_id == session_id)
-            )
+        async with self.db_manager.get_read_session() as session:
+            result = await session.execute(_GET_USER_SESSION, {"session_id": session_id})
             user_session = result.scalar_one_or_none()
             return user_session.to_pydantic(UserSession) if user_session else None
     
     async def delete_user_session(self, session_id: str) -> bool:
         """Delete user session."""
         async with self.db_manager.get_async_session() as session:
+            # Sessions own no cascaded rows, so a single DELETE replaces load-then-delete
             result = await session.execute(
-                select(UserSessionModel).where(UserSessionModel.session_id == session_id)
+                delete(UserSessionModel).where(UserSessionModel.session_id == session_id)
             )
-            user_session = result.scalar_one_or_none()
-            if user_session:
-                await session.delete(user_session)
-                return True
-            return False
+            return result.rowcount > 0
     
     # ========================
     # PROJECT OPERATIONS
@@ -131,45 +138,64 @@ class DatabaseService:
             await session.flush()
             return db_project.to_pydantic(Project)
     
-    async def get_project(self, project_id: str) -> Optional[Project]:
-        """Get project by ID."""
+    async def create_projects_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert many projects in one executemany round trip."""
+        if not rows:
+            return 0
         async with self.db_manager.get_async_session() as session:
+            await session.execute(insert(ProjectModel), rows)
+        return len(rows)
+    
+    async def get_existing_project_ids(self, project_ids: List[str]) -> set:
+        """Return which of the given project IDs are already stored."""
+        if not project_ids:
+            return set()
+        async with self.db_manager.get_read_session() as session:
             result = await session.execute(
-                select(ProjectModel).where(ProjectModel.id == project_id)
+                select(ProjectModel.id).where(ProjectModel.id.in_(project_ids))
             )
+            return {str(project_id) for project_id in result.scalars().all()}
+    
+    async def get_project(self, project_id: str) -> Optional[Project]:
+        """Get project by ID."""
+        async with self.db_manager.get_read_session() as session:
+            result = await session.execute(_GET_PROJECT, {"project_id": project_id})
             project = result.scalar_one_or_none()
             return project.to_pydantic(Project) if project else None
     
     async def get_user_projects(self, user_id: str) -> List[Project]:
         """Get all projects for a user."""
-        async with self.db_manager.get_async_session() as session:
+        async with self.db_manager.get_read_session() as session:
             result = await session.execute(
                 select(ProjectModel)
                 .where(ProjectModel.created_by == user_id)
                 .order_by(desc(ProjectModel.updated_at))
+                .options(raiseload('*'))  # Fail loudly instead of lazy-loading per row
             )
             projects = result.scalars().all()
             return [project.to_pydantic(Project) for project in projects]
     
     async def update_project(self, project_id: str, updates: Dict[str, Any]) -> Optional[Project]:
         """Update project data."""
+        values = _column_values(ProjectModel, updates)
+        if not values:
+            return await self.get_project(project_id)
+        
         async with self.db_manager.get_async_session() as session:
             result = await session.execute(
-                select(ProjectModel).where(ProjectModel.id == project_id)
+                update(ProjectModel)
+                .where(ProjectModel.id == project_id)
+                .values(**values)
+                .returning(ProjectModel)
+                .execution_options(synchronize_session=False)
             )
             project = result.scalar_one_or_none()
-            if not project:
-                return None
-            
-            project.update_from_dict(updates)
-            return project.to_pydantic(Project)
+            return project.to_pydantic(Project) if project else None
     
     async def delete_project(self, project_id: str) -> bool:
         """Delete project."""
         async with self.db_manager.get_async_session() as session:
-            result = await session.execute(
-                select(ProjectModel).where(ProjectModel.id == project_id)
-            )
+            result = await session.execute(_GET_PROJECT, {"project_id": project_id})
             project = result.scalar_one_or_none()
             if project:
                 await session.delete(project)
@@ -190,20 +216,19 @@ class DatabaseService:
     
     async def get_chat_session(self, session_id: str) -> Optional[ChatSession]:
         """Get chat session by ID."""
-        async with self.db_manager.get_async_session() as session:
-            result = await session.execute(
-                select(ChatSessionModel).where(ChatSessionModel.session_id == session_id)
-            )
+        async with self.db_manager.get_read_session() as session:
+            result = await session.execute(_GET_CHAT_SESSION, {"session_id": session_id})
             chat_session = result.scalar_one_or_none()
             return chat_session.to_pydantic(ChatSession) if chat_session else None
     
     async def get_user_chat_sessions(self, user_id: str) -> List[ChatSession]:
         """Get all chat sessions for a user."""
-        async with self.db_manager.get_async_session() as session:
+        async with self.db_manager.get_read_session() as session:
             result = await session.execute(
                 select(ChatSessionModel)
                 .where(ChatSessionModel.user_id == user_id)
                 .order_by(desc(ChatSessionModel.last_activity))
+                .options(raiseload('*'))
             )
             sessions = result.scalars().all()
             return [session.to_pydantic(ChatSession) for session in sessions]
@@ -234,24 +259,24 @@ class DatabaseService:
     
     async def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        async with self.db_manager.get_async_session() as session:
+        async with self.db_manager.get_read_session() as session:
             # Count records in main tables
             stats = {}
             
             # Users
-            result = await session.execute(select(UserModel).count())
+            result = await session.execute(select(func.count()).select_from(UserModel))
             stats['users'] = result.scalar()
             
             # Projects  
-            result = await session.execute(select(ProjectModel).count())
+            result = await session.execute(select(func.count()).select_from(ProjectModel))
             stats['projects'] = result.scalar()
             
             # Chat sessions
-            result = await session.execute(select(ChatSessionModel).count())
+            result = await session.execute(select(func.count()).select_from(ChatSessionModel))
             stats['chat_sessions'] = result.scalar()
             
             # Webhook events
-            result = await session.execute(select(WebhookEventModel).count())
+            result = await session.execute(select(func.count()).select_from(WebhookEventModel))
             stats['webhook_events'] = result.scalar()
             
             return stats
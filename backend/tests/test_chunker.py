@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+from chonkie.types import Chunk as ChonkieChunk
+
+from rag.preprocessing.chunker import SMALL_INPUT_CHARS, TextChunker
+
+
+def make_chunker(chunk_size, strategy="token"):
+    chunker = TextChunker.__new__(TextChunker)
+    chunker.chunk_size = chunk_size
+    chunker.strategy = strategy
+    chunker.language = None
+    chunker._chunker = Mock()
+    return chunker
+
+
+@pytest.mark.parametrize("length, expected", [(100, True), (101, False)])
+def test_ascii_input_fits_up_to_chunk_size(length, expected):
+    assert make_chunker(100)._fits_single_chunk("a" * length) is expected
+
+
+@pytest.mark.parametrize("length, expected", [(24, True), (25, False)])
+def test_non_ascii_input_allows_four_tokens_per_char(length, expected):
+    assert make_chunker(100)._fits_single_chunk("字" * length) is expected
+    assert make_chunker(100)._fits_single_chunk("😀" * length) is expected
+
+
+def test_non_ascii_input_bounded_by_small_input_chars():
+    chunker = make_chunker(1000)
+    assert chunker._fits_single_chunk("字" * (SMALL_INPUT_CHARS - 1))
+    assert not chunker._fits_single_chunk("字" * SMALL_INPUT_CHARS)
+
+
+@pytest.mark.parametrize("strategy", ["semantic", "late"])
+def test_topic_strategies_never_take_fast_path(strategy):
+    assert not make_chunker(1000, strategy=strategy)._fits_single_chunk("short")
+
+
+def test_short_semantic_input_goes_through_chonkie():
+    chunker = make_chunker(1000, strategy="semantic")
+    text = "Cats purr. Rockets launch."
+    chunker._chunker.chunk.return_value = [
+        ChonkieChunk(text="Cats purr.", start_index=0, end_index=10, token_count=3),
+        ChonkieChunk(text=" Rockets launch.", start_index=10, end_index=len(text), token_count=3),
+    ]
+
+    chunks = chunker.chunk_text(text, file_id="file-1")
+
+    chunker._chunker.chunk.assert_called_once_with(text)
+    assert [chunk.content for chunk in chunks] == ["Cats purr.", " Rockets launch."]
+
+
+def test_short_token_input_skips_chonkie():
+    chunker = make_chunker(1000)
+
+    chunks = chunker.chunk_text("def f(): pass", file_id="file-1")
+
+    chunker._chunker.chunk.assert_not_called()
+    assert [chunk.content for chunk in chunks] == ["def f(): pass"]
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from utils.github_utils import GitHubAPIClient
+
+
+class FakeResponse:
+    def __init__(self, status=200, data=None, headers=None):
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.ok = status < 400
+        self.headers = headers or {}
+        self._data = data
+
+    async def json(self):
+        return self._data
+
+    async def text(self):
+        return "error"
+
+
+class FakeRequest:
+    def __init__(self, session, response):
+        self.session = session
+        self.response = response
+
+    async def __aenter__(self):
+        await self.session.gate.wait()
+        return self.response
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Stands in for aiohttp.ClientSession; responses are served in order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    def request(self, method, url, headers=None, params=None, json=None):
+        self.calls.append({"method": method, "url": url, "headers": headers})
+        return FakeRequest(self, self.responses.pop(0))
+
+
+def make_client(*responses):
+    client = GitHubAPIClient()
+    session = FakeSession(*responses)
+    client._session = session
+    return client, session
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request():
+    client, session = make_client(FakeResponse(data={"name": "repo"}))
+    session.gate.clear()
+
+    callers = [asyncio.ensure_future(client.get("/repos/o/r", token="t")) for _ in range(5)]
+    await asyncio.sleep(0)
+    session.gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert len(session.calls) == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == {"name": "repo"}
+
+
+@pytest.mark.asyncio
+async def test_failed_flight_reaches_every_waiter_and_is_cleared():
+    client, session = make_client(FakeResponse(status=500))
+    session.gate.clear()
+
+    callers = [asyncio.ensure_future(client.get("/repos/o/r", token="t")) for _ in range(3)]
+    await asyncio.sleep(0)
+    session.gate.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert len(session.calls) == 1
+    assert all(isinstance(result, Exception) and "500" in str(result) for result in results)
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_shared_request_alive():
+    client, session = make_client(FakeResponse(data={"name": "repo"}))
+    session.gate.clear()
+
+    cancelled = asyncio.ensure_future(client.get("/repos/o/r", token="t"))
+    survivor = asyncio.ensure_future(client.get("/repos/o/r", token="t"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    session.gate.set()
+
+    assert await survivor == {"name": "repo"}
+    assert cancelled.cancelled()
+    assert len(session.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_not_modified_reserves_stored_data_and_refreshes_cache():
+    client, session = make_client(
+        FakeResponse(data={"name": "repo"}, headers={"ETag": '"abc"'}),
+        FakeResponse(status=304),
+    )
+    url = f"{client.base_url}/repos/o/r"
+
+    first = await client.get("/repos/o/r", token="t")
+    # Simulate TTL expiry; the ETag validator outlives the cached entry
+    client.cache_manager.cache.clear()
+    second = await client.get("/repos/o/r", token="t")
+
+    assert len(session.calls) == 2
+    assert "If-None-Match" not in session.calls[0]["headers"]
+    assert session.calls[1]["headers"]["If-None-Match"] == '"abc"'
+    assert second == first == {"name": "repo"}
+    assert client.cache_manager.get(url) is not None
+    assert client.cache_manager.statistics["revalidated"] == 1
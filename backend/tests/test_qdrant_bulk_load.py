@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from vectorstore.qdrant.client import EnhancedQdrantClient
+
+
+def make_client():
+    client = EnhancedQdrantClient.__new__(EnhancedQdrantClient)
+    client.client = AsyncMock()
+    client.collection_name = "test"
+    client.indexing_threshold = 50000
+    client._bulk_loads = 0
+    client._bulk_lock = asyncio.Lock()
+    return client
+
+
+def thresholds(client):
+    return [
+        call.kwargs["optimizers_config"].indexing_threshold
+        for call in client.client.update_collection.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_bulk_loads_restore_indexing_once_at_the_end():
+    client = make_client()
+    first_done = asyncio.Event()
+
+    async def first():
+        async with client.bulk_load():
+            await first_done.wait()
+
+    async def second():
+        async with client.bulk_load():
+            first_done.set()
+            await asyncio.sleep(0)
+            # The first load has exited; indexing must still be paused
+            assert thresholds(client) == [0]
+
+    await asyncio.gather(first(), second())
+
+    assert thresholds(client) == [0, 50000]
+    assert client._bulk_loads == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_bulk_load_releases_its_reference():
+    client = make_client()
+
+    with pytest.raises(RuntimeError):
+        async with client.bulk_load():
+            raise RuntimeError("upload failed")
+
+    assert thresholds(client) == [0, 50000]
+    assert client._bulk_loads == 0
@@ -0,0 +1,190 @@
+import asyncio
+import math
+from unittest.mock import AsyncMock
+
+import pytest
+
+from utils import caching
+from utils.caching import SemanticCache
+
+
+def at_angle(similarity):
+    """Unit vector whose cosine similarity with [1, 0] is ``similarity``."""
+    return [similarity, math.sqrt(max(0.0, 1.0 - similarity ** 2))]
+
+
+BASE = [1.0, 0.0]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(caching.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_at_threshold_and_miss_below():
+    cache = SemanticCache(threshold=0.9, dedupe_threshold=0.99)
+    cache.set(BASE, "value")
+
+    assert cache.get(at_angle(0.95)) == "value"
+    assert cache.get(at_angle(0.9001)) == "value"
+    assert cache.get(at_angle(0.89)) is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SemanticCache(threshold=0.9, ttl=10)
+    cache.set(BASE, "value")
+
+    clock[0] += 9
+    assert cache.get(BASE) == "value"
+    clock[0] += 2
+    assert cache.get(BASE) is None
+
+
+def test_near_duplicate_insert_replaces_entry():
+    cache = SemanticCache(threshold=0.9, dedupe_threshold=0.99)
+    cache.set(BASE, "old")
+    cache.set(at_angle(0.995), "new")
+
+    bucket = cache._buckets[None]
+    assert bucket.values == ["new"]
+    assert cache.get(BASE) == "new"
+
+
+def test_distinct_insert_keeps_both_entries():
+    cache = SemanticCache(threshold=0.9, dedupe_threshold=0.99)
+    cache.set(BASE, "first")
+    cache.set([0.0, 1.0], "second")
+
+    assert cache.get(BASE) == "first"
+    assert cache.get([0.0, 1.0]) == "second"
+
+
+def test_max_entries_evicts_oldest():
+    cache = SemanticCache(threshold=0.99, dedupe_threshold=0.999, max_entries=2)
+    cache.set([1.0, 0.0, 0.0], "a")
+    cache.set([0.0, 1.0, 0.0], "b")
+    cache.set([0.0, 0.0, 1.0], "c")
+
+    assert cache.get([1.0, 0.0, 0.0]) is None
+    assert cache.get([0.0, 1.0, 0.0]) == "b"
+    assert cache.get([0.0, 0.0, 1.0]) == "c"
+
+
+def test_scopes_are_isolated():
+    cache = SemanticCache(threshold=0.9)
+    cache.set(BASE, "limit-5", scope=(5, None))
+
+    assert cache.get(BASE, scope=(5, None)) == "limit-5"
+    assert cache.get(BASE, scope=(10, None)) is None
+    assert cache.get(BASE) is None
+
+
+def test_clear_drops_all_scopes():
+    cache = SemanticCache(threshold=0.9)
+    cache.set(BASE, "a", scope="one")
+    cache.set(BASE, "b", scope="two")
+    cache.clear()
+
+    assert cache.get(BASE, scope="one") is None
+    assert cache.get(BASE, scope="two") is None
+
+
+def make_qdrant_client():
+    from vectorstore.qdrant.client import EnhancedQdrantClient
+
+    client = EnhancedQdrantClient.__new__(EnhancedQdrantClient)
+    client.client = AsyncMock()
+    client.collection_name = "test"
+    client._search_cache = SemanticCache(threshold=0.9)
+    client._stats_cache = (0.0, {})
+    client._cache_generation = 0
+    client._search_cache.set(BASE, [{"chunk_id": "1", "payload": {}}])
+    return client
+
+
+@pytest.mark.asyncio
+async def test_upsert_clears_search_cache():
+    from models.api.file_models import DocumentChunk
+
+    client = make_qdrant_client()
+    await client.upsert_chunks([DocumentChunk.model_construct(chunk_id="1", file_id="file-1", content="x")])
+
+    assert client._search_cache.get(BASE) is None
+    assert client._stats_cache is None
+
+
+@pytest.mark.asyncio
+async def test_delete_clears_search_cache():
+    client = make_qdrant_client()
+    await client.delete_by_file_id("file-1")
+
+    assert client._search_cache.get(BASE) is None
+    assert client._stats_cache is None
+
+
+@pytest.mark.asyncio
+async def test_cached_search_results_are_copies():
+    from types import SimpleNamespace
+
+    client = make_qdrant_client()
+    client._search_cache.clear()
+    client.vector_size = 2
+    client._search_params = None
+    client.client.search.return_value = [
+        SimpleNamespace(id="1", score=0.9, payload={"content": "x", "tags": ["a"]})
+    ]
+
+    first = await client.search_similar(BASE, limit=5)
+    first[0]["payload"]["tags"].append("mutated")
+    second = await client.search_similar(BASE, limit=5)
+
+    assert client.client.search.await_count == 1
+    assert second[0]["payload"]["tags"] == ["a"]
+
+
+def make_searchable_client():
+    from types import SimpleNamespace
+
+    client = make_qdrant_client()
+    client._search_cache.clear()
+    client.vector_size = 2
+    client._search_params = None
+    client.client.search.return_value = [SimpleNamespace(id="1", score=0.9, payload={})]
+    return client
+
+
+@pytest.mark.asyncio
+async def test_search_after_write_misses_cache():
+    client = make_searchable_client()
+
+    await client.search_similar(BASE, limit=5)
+    await client.delete_by_file_id("file-1")
+    await client.search_similar(BASE, limit=5)
+
+    assert client.client.search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_overlapping_write_is_not_cached():
+    client = make_searchable_client()
+    gate = asyncio.Event()
+    results = client.client.search.return_value
+
+    async def slow_search(**kwargs):
+        await gate.wait()
+        return results
+
+    client.client.search.side_effect = slow_search
+
+    # The search reads pre-write data, and the write completes before it returns
+    in_flight = asyncio.ensure_future(client.search_similar(BASE, limit=5))
+    await asyncio.sleep(0)
+    await client.delete_by_file_id("file-1")
+    gate.set()
+    await in_flight
+
+    await client.search_similar(BASE, limit=5)
+
+    assert client.client.search.await_count == 2
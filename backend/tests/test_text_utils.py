@@ -0,0 +1,24 @@
+from utils.text_utils import approx_token_count
+
+
+INDENTED_CODE = '''
+class Example:
+    def method(self, value):
+        if value:
+            return   value  *  2
+        return None
+'''
+
+
+def test_approx_token_count_matches_split_on_indented_code():
+    assert approx_token_count(INDENTED_CODE) == len(INDENTED_CODE.split())
+
+
+def test_approx_token_count_handles_mixed_whitespace():
+    text = "alpha\t\tbeta\n\n  gamma \r\n delta"
+    assert approx_token_count(text) == len(text.split()) == 4
+
+
+def test_approx_token_count_empty_and_blank_text():
+    assert approx_token_count("") == 0
+    assert approx_token_count("   \n\t  ") == len("   \n\t  ".split()) == 0
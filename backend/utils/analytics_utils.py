@@ -2,6 +2,7 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import structlog
+from cachetools import TTLCache
 
 from config.settings import get_settings
 from utils.github_utils import github_service
@@ -23,26 +24,17 @@ class AnalyticsCache:
     """Simple in-memory cache for analytics data"""
     
     def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
         self._cache_ttl = 3600  # 1 hour TTL
+        # Bounded, and expired entries are dropped even if never read again
+        self._cache: TTLCache = TTLCache(maxsize=1000, ttl=self._cache_ttl)
     
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get cached analytics data"""
-        if key in self._cache:
-            cached_data = self._cache[key]
-            if cached_data.get('expires_at', 0) > datetime.now().timestamp():
-                return cached_data.get('data')
-            else:
-                # Remove expired data
-                del self._cache[key]
-        return None
+        return self._cache.get(key)
     
     def set(self, key: str, data: Dict[str, Any]) -> None:
         """Cache analytics data"""
-        self._cache[key] = {
-            'data': data,
-            'expires_at': datetime.now().timestamp() + self._cache_ttl
-        }
+        self._cache[key] = data
     
     def clear(self, pattern: Optional[str] = None) -> None:
         """Clear cache entries matching pattern"""
@@ -51,7 +43,7 @@ class AnalyticsCache:
         else:
             keys_to_remove = [key for key in self._cache.keys() if pattern in key]
             for key in keys_to_remove:
-                del self._cache[key]
+                self._cache.pop(key, None)
 
 # Global cache instance
 analytics_cache = AnalyticsCache()
@@ -75,8 +67,10 @@ class AnalyticsService:
             logger.info("Generating user analytics overview", user_id=user_id)
             
             # Fetch fresh data
-            repositories = await github_service.get_user_repositories(page=1, per_page=100)
-            activity = await github_service.get_user_activity('user', page=1, per_page=100)
+            repositories, activity = await asyncio.gather(
+                github_service.get_user_repositories(page=1, per_page=100),
+                github_service.get_user_activity('user', page=1, per_page=100)
+            )
             
             # Calculate analytics
             analytics_data = await self._calculate_user_analytics(repositories, activity)
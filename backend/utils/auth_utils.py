@@ -94,6 +94,7 @@ class GitHubOAuth:
         self.client_id = os.getenv('GITHUB_CLIENT_ID')
         self.client_secret = os.getenv('GITHUB_CLIENT_SECRET')
         self.callback_url = os.getenv('GITHUB_CALLBACK_URL')
+        self._allowed_origins: Optional[tuple] = None
         # print('GITHUB_CLIENT_ID:', self.client_id)
         # print('GITHUB_CLIENT_SECRET:', self.client_secret)
         # print('GITHUB_CALLBACK_URL:', self.callback_url)
@@ -104,14 +105,17 @@ class GitHubOAuth:
     
     def get_allowed_origins(self) -> List[str]:
         """Get allowed origins for redirect URI validation."""
-        origins = os.getenv('ALLOWED_ORIGINS', '').split(',')
-        origins = [origin.strip() for origin in origins if origin.strip()]
-        
-        # Add default development origins if not in production
-        if os.getenv('NODE_ENV') != 'production':
-            origins.extend(['http://localhost:3000', 'http://127.0.0.1:3000'])
+        if self._allowed_origins is None:
+            origins = os.getenv('ALLOWED_ORIGINS', '').split(',')
+            origins = [origin.strip() for origin in origins if origin.strip()]
+            
+            # Add default development origins if not in production
+            if os.getenv('NODE_ENV') != 'production':
+                origins.extend(['http://localhost:3000', 'http://127.0.0.1:3000'])
+            
+            self._allowed_origins = tuple(origins)
         
-        return origins
+        return list(self._allowed_origins)
     
     def generate_auth_url(self, state: str) -> str:
         """Generate GitHub OAuth authorization URL."""
@@ -1,5 +1,160 @@
 
-from cachetools import TTLCache
+import hashlib
+import json
+import time
+from typing import Any, Hashable, List, Optional, Sequence
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+
+# Faster canonical encoding and hashing for cache keys; fall back if absent
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Compiled similarity scan for the semantic cache; fall back to numpy if absent
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # In-memory cache with a TTL of 15 minutes
 cache = TTLCache(maxsize=100, ttl=900)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Digest of JSON-like parts that does not depend on dict key order."""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(parts, default=str, sort_keys=True, separators=(",", ":")).encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _best_match(matrix, vector):
+        # One pass over the rows keeping the running best, with no
+        # intermediate score array
+        best_index = -1
+        best_score = -np.inf
+        for i in range(matrix.shape[0]):
+            score = 0.0
+            for j in range(matrix.shape[1]):
+                score += matrix[i, j] * vector[j]
+            if score > best_score:
+                best_index = i
+                best_score = score
+        return best_index, best_score
+else:
+    def _best_match(matrix, vector):
+        scores = matrix @ vector
+        best_index = int(np.argmax(scores))
+        return best_index, scores[best_index]
+
+
+class _SemanticBucket:
+    """Entries sharing one scope: unit vectors plus their values and expiries."""
+    __slots__ = ("vectors", "values", "expires_at")
+    
+    def __init__(self, dim: int):
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+        self.values: List[Any] = []
+        self.expires_at: List[float] = []
+
+
+class SemanticCache:
+    """Cache looked up by embedding similarity instead of an exact key.
+    
+    Entries are grouped by scope, which holds whatever must match exactly
+    (filters, limits). A lookup returns the value of the closest unexpired
+    entry in the scope when its cosine similarity reaches ``threshold``; an
+    insert within ``dedupe_threshold`` of an existing entry replaces it.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.97,
+        dedupe_threshold: float = 0.99,
+        ttl: float = 900,
+        max_entries: int = 256,
+        max_scopes: int = 64
+    ):
+        self.threshold = threshold
+        self.dedupe_threshold = dedupe_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._buckets: LRUCache = LRUCache(maxsize=max_scopes)
+    
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    @staticmethod
+    def _expire(bucket: _SemanticBucket) -> None:
+        now = time.monotonic()
+        if bucket.expires_at and bucket.expires_at[0] <= now:
+            keep = [i for i, expires_at in enumerate(bucket.expires_at) if expires_at > now]
+            bucket.vectors = bucket.vectors[keep]
+            bucket.values = [bucket.values[i] for i in keep]
+            bucket.expires_at = [bucket.expires_at[i] for i in keep]
+    
+    @staticmethod
+    def _closest(bucket: _SemanticBucket, vector: np.ndarray) -> Optional[tuple]:
+        if not bucket.values or bucket.vectors.shape[1] != vector.shape[0]:
+            return None
+        best, score = _best_match(bucket.vectors, vector)
+        return int(best), float(score)
+    
+    def get(self, embedding: Sequence[float], scope: Hashable = None) -> Optional[Any]:
+        """Return the cached value for the most similar embedding, if close enough."""
+        bucket = self._buckets.get(scope)
+        if bucket is None:
+            return None
+        
+        self._expire(bucket)
+        closest = self._closest(bucket, self._normalize(embedding))
+        if closest is None or closest[1] < self.threshold:
+            return None
+        return bucket.values[closest[0]]
+    
+    def set(self, embedding: Sequence[float], value: Any, scope: Hashable = None) -> None:
+        """Cache a value under an embedding."""
+        vector = self._normalize(embedding)
+        bucket = self._buckets.get(scope)
+        if bucket is None or bucket.vectors.shape[1] != vector.shape[0]:
+            bucket = self._buckets[scope] = _SemanticBucket(vector.shape[0])
+        
+        self._expire(bucket)
+        # Entries are appended in insertion order, so expiries stay sorted
+        expires_at = time.monotonic() + self.ttl
+        
+        closest = self._closest(bucket, vector)
+        if closest is not None and closest[1] >= self.dedupe_threshold:
+            index = closest[0]
+            del bucket.values[index], bucket.expires_at[index]
+            bucket.vectors = np.delete(bucket.vectors, index, axis=0)
+        elif len(bucket.values) >= self.max_entries:
+            del bucket.values[0], bucket.expires_at[0]
+            bucket.vectors = bucket.vectors[1:]
+        
+        bucket.vectors = np.vstack([bucket.vectors, vector])
+        bucket.values.append(value)
+        bucket.expires_at.append(expires_at)
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._buckets.clear()
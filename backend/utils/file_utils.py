@@ -5,6 +5,7 @@ Handles all file types with comprehensive language and content detection.
 
 import os
 import mimetypes
+from itertools import accumulate
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import structlog
@@ -173,6 +174,14 @@ LANGUAGE_MAPPING = {
     '.s': 'assembly',
     '.S': 'assembly'
 }
+SUPPORTED_EXTENSIONS = frozenset(LANGUAGE_MAPPING)
+
+# Extension -> FileType, resolved with a single dict lookup (code wins on overlap)
+_EXTENSION_FILE_TYPES: Dict[str, FileType] = {
+    **dict.fromkeys(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg', '.webp'), FileType.IMAGE),
+    **dict.fromkeys(('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'), FileType.DOCUMENT),
+    **dict.fromkeys(LANGUAGE_MAPPING, FileType.CODE),
+}
 
 
 class FileProcessor:
@@ -180,7 +189,7 @@ class FileProcessor:
     
     def __init__(self):
         """Initialize the file processor."""
-        self.supported_extensions = set(LANGUAGE_MAPPING.keys())
+        self.supported_extensions = SUPPORTED_EXTENSIONS
         self.max_file_size_mb = 100  # Maximum file size in MB
         
     async def process_file(self, file_path: str, **kwargs) -> Dict[str, Any]:
@@ -352,22 +361,7 @@ class FileProcessor:
             
             # Check extension
             extension = Path(file_path).suffix.lower()
-            
-            # Code files
-            if extension in LANGUAGE_MAPPING:
-                return FileType.CODE
-            
-            # Document files
-            doc_extensions = {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'}
-            if extension in doc_extensions:
-                return FileType.DOCUMENT
-            
-            # Image files
-            img_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg', '.webp'}
-            if extension in img_extensions:
-                return FileType.IMAGE
-            
-            return FileType.TEXT
+            return _EXTENSION_FILE_TYPES.get(extension, FileType.TEXT)
             
         except Exception as e:
             logger.warning(f"Failed to detect file type for {file_path}", error=str(e))
@@ -382,7 +376,7 @@ class FileProcessor:
             return LANGUAGE_MAPPING[extension]
         
         # Default to generic for text files
-        if extension in ['.txt', '.log', '.md']:
+        if extension in ('.txt', '.log', '.md'):
             return 'generic'
         
         # Use MIME type as fallback
@@ -529,50 +523,52 @@ class FileProcessor:
         if not content.strip():
             return []
         
-        # Enhanced chunking strategy for better RAG performance
+        # Enhanced chunking strategy for better RAG performance.
+        # Chunks are sliced straight out of ``content`` via line offsets rather
+        # than re-joined from the split lines.
         lines = content.split('\n')
+        starts = _line_starts(lines)
         elements = []
-        current_chunk = []
-        current_line_count = 0
+        chunk_start = 0       # Index of the first line in the current chunk
+        chunk_chars = 0       # Characters in the current chunk, excluding newlines
         chunk_size_limit = 500  # Target chunk size in characters
         min_chunk_size = 50     # Minimum chunk size
         
         for i, line in enumerate(lines):
-            current_chunk.append(line)
-            current_line_count += 1
+            chunk_chars += len(line)
             
             # Create chunk when we hit size limit or encounter natural breaks
             should_create_chunk = (
-                len(''.join(current_chunk)) >= chunk_size_limit or
-                (line.strip() == '' and len(''.join(current_chunk)) >= min_chunk_size) or
+                chunk_chars >= chunk_size_limit or
+                (line.strip() == '' and chunk_chars >= min_chunk_size) or
                 (i < len(lines) - 1 and lines[i + 1].startswith('#')) or  # Next line is a header
                 (i < len(lines) - 1 and lines[i + 1].startswith('```')) or  # Next line is code block
                 i == len(lines) - 1  # Last line
             )
             
-            if should_create_chunk and len(''.join(current_chunk)) >= min_chunk_size:
-                chunk_text = '\n'.join(current_chunk).strip()
+            if should_create_chunk and chunk_chars >= min_chunk_size:
+                chunk_text = content[starts[chunk_start]:starts[i + 1] - 1].strip()
                 if chunk_text:
                     element = self._create_text_element(
                         chunk_text, 
                         len(elements),
-                        start_line=i - current_line_count + 1,
+                        start_line=chunk_start,
                         end_line=i
                     )
                     elements.append(element)
                 
                 # Reset for next chunk
-                current_chunk = []
-                current_line_count = 0
+                chunk_start = i + 1
+                chunk_chars = 0
         
         # Handle any remaining content
-        if current_chunk and len(''.join(current_chunk)) >= min_chunk_size:
-            chunk_text = '\n'.join(current_chunk).strip()
+        if chunk_start < len(lines) and chunk_chars >= min_chunk_size:
+            chunk_text = content[starts[chunk_start]:].strip()
             if chunk_text:
                 element = self._create_text_element(
                     chunk_text, 
                     len(elements),
-                    start_line=len(lines) - len(current_chunk),
+                    start_line=chunk_start,
                     end_line=len(lines) - 1
                 )
                 elements.append(element)
@@ -584,18 +580,19 @@ class FileProcessor:
         if not content.strip():
             return []
         
-        # Enhanced markdown processing with better chunking
+        # Enhanced markdown processing with better chunking.
+        # Sections are sliced straight out of ``content`` via line offsets.
         lines = content.split('\n')
+        starts = _line_starts(lines)
         elements = []
-        current_section = []
         current_header = None
         section_start_line = 0
         
         for i, line in enumerate(lines):
             if line.startswith('#'):
                 # Save previous section
-                if current_section:
-                    section_text = '\n'.join(current_section).strip()
+                if i > section_start_line:
+                    section_text = content[starts[section_start_line]:starts[i] - 1].strip()
                     if section_text:
                         element = self._create_text_element(
                             section_text, 
@@ -608,23 +605,19 @@ class FileProcessor:
                 
                 # Start new section
                 current_header = line.strip()
-                current_section = [line]
                 section_start_line = i
-            else:
-                current_section.append(line)
         
         # Save last section
-        if current_section:
-            section_text = '\n'.join(current_section).strip()
-            if section_text:
-                element = self._create_text_element(
-                    section_text, 
-                    len(elements), 
-                    current_header,
-                    start_line=section_start_line,
-                    end_line=len(lines) - 1
-                )
-                elements.append(element)
+        section_text = content[starts[section_start_line]:].strip()
+        if section_text:
+            element = self._create_text_element(
+                section_text, 
+                len(elements), 
+                current_header,
+                start_line=section_start_line,
+                end_line=len(lines) - 1
+            )
+            elements.append(element)
         
         return elements
     
@@ -649,24 +642,37 @@ class FileProcessor:
     
     def _create_text_element(self, text: str, index: int, header: str = None, start_line: int = None, end_line: int = None) -> Any:
         """Create a text element with enhanced metadata for RAG processing."""
-        class TextElement:
-            def __init__(self, text, index, header=None, start_line=None, end_line=None):
-                self.text = text
-                self.metadata = {
-                    "index": index,
-                    "header": header,
-                    "start_line": start_line if start_line is not None else index,
-                    "end_line": end_line if end_line is not None else index + text.count('\n'),
-                    "start_char": 0,  # Will be calculated when needed
-                    "end_char": len(text),
-                    "element_type": "text",
-                    "chunk_size": len(text)
-                }
-        
         return TextElement(text, index, header, start_line, end_line)
 
 
+class TextElement:
+    """Text chunk produced by the built-in text/markdown chunkers."""
+    
+    __slots__ = ("text", "metadata")
+    
+    def __init__(self, text, index, header=None, start_line=None, end_line=None):
+        self.text = text
+        self.metadata = {
+            "index": index,
+            "header": header,
+            "start_line": start_line if start_line is not None else index,
+            "end_line": end_line if end_line is not None else index + text.count('\n'),
+            "start_char": 0,  # Will be calculated when needed
+            "end_char": len(text),
+            "element_type": "text",
+            "chunk_size": len(text)
+        }
+
+
 # Utility functions
+def _line_starts(lines: List[str]) -> List[int]:
+    """Character offset of each line in the joined content, plus an end sentinel.
+
+    Line ``i`` spans ``content[starts[i]:starts[i + 1] - 1]``.
+    """
+    return list(accumulate((len(line) + 1 for line in lines), initial=0))
+
+
 def get_file_size_mb(file_path: str) -> float:
     """Get file size in megabytes."""
     try:
@@ -11,6 +11,13 @@ import aiohttp
 import logging
 from cachetools import TTLCache
 
+# xxh3 derives cache keys several times faster than md5; fall back if absent
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from config.settings import get_settings
 from config.key_manager import KeyManager
 
@@ -89,11 +96,15 @@ class GitHubRateLimitManager:
 class GitHubCacheManager:
     """GitHub API response cache manager."""
     
-    def __init__(self, max_size: int = 1000, ttl: int = 300):
+    def __init__(self, max_size: int = 1000, ttl: int = 300, validator_ttl: int = 3600):
         self.cache = TTLCache(maxsize=max_size, ttl=ttl)
+        # ETag validators (with their payloads) outlive the response TTL so stale
+        # entries can be revalidated, but within the same size budget
+        self.validators = TTLCache(maxsize=max_size, ttl=validator_ttl)
         self.statistics = {
             'hits': 0,
             'misses': 0,
+            'revalidated': 0,
             'size': 0
         }
     
@@ -101,6 +112,8 @@ class GitHubCacheManager:
         """Generate cache key from URL and parameters."""
         if params:
             url += '?' + urlencode(sorted(params.items()), doseq=True)
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(url.encode())
         return hashlib.md5(url.encode()).hexdigest()
     
     def get(self, url: str, params: Dict[str, Any] = None) -> Optional[Any]:
@@ -114,15 +127,22 @@ class GitHubCacheManager:
         self.statistics['misses'] += 1
         return None
     
-    def set(self, url: str, data: Any, params: Dict[str, Any] = None):
+    def get_validator(self, url: str, params: Dict[str, Any] = None) -> Optional[Tuple[str, Any]]:
+        """Get the stored (etag, data) pair for a conditional request."""
+        return self.validators.get(self._generate_key(url, params))
+    
+    def set(self, url: str, data: Any, params: Dict[str, Any] = None, etag: Optional[str] = None):
         """Cache response data."""
         key = self._generate_key(url, params)
         self.cache[key] = data
+        if etag:
+            self.validators[key] = (etag, data)
         self.statistics['size'] = len(self.cache)
     
     def clear(self):
         """Clear all cached data."""
         self.cache.clear()
+        self.validators.clear()
         self.statistics['size'] = 0
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -132,6 +152,7 @@ class GitHubCacheManager:
         return {
             'hits': self.statistics['hits'],
             'misses': self.statistics['misses'],
+            'revalidated': self.statistics['revalidated'],
             'size': self.statistics['size'],
             'hit_rate': (self.statistics['hits'] / total_requests * 100) if total_requests > 0 else 0
         }
@@ -145,6 +166,20 @@ class GitHubAPIClient:
         self.rate_limit_manager = GitHubRateLimitManager()
         self.cache_manager = GitHubCacheManager()
         self.timeout = aiohttp.ClientTimeout(total=30)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._inflight: Dict[Tuple[str, Optional[str], Optional[str]], asyncio.Future] = {}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def _make_request(
         self,
@@ -159,12 +194,39 @@ class GitHubAPIClient:
         url = f"{self.base_url}{endpoint}"
         
         # Check cache first for GET requests
+        validator = None
         if method.upper() == 'GET' and use_cache and not "events" in endpoint:
             cached_response = self.cache_manager.get(url, params)
             if cached_response:
                 self.rate_limit_manager.statistics['cache_hits'] += 1
                 return cached_response
+            validator = self.cache_manager.get_validator(url, params)
+            
+            # Coalesce concurrent misses for the same resource into one request
+            flight_key = (url, token, repr(sorted(params.items())) if params else None)
+            inflight = self._inflight.get(flight_key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(
+                    self._send_request(method, url, endpoint, token, params, data, use_cache, validator)
+                )
+                self._inflight[flight_key] = inflight
+                inflight.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+            return await asyncio.shield(inflight)
         
+        return await self._send_request(method, url, endpoint, token, params, data, use_cache, validator)
+    
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        token: Optional[str],
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        use_cache: bool,
+        validator: Optional[Tuple[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Send a GitHub API request and cache successful GET responses."""
         # Prepare headers
         headers = {
             'Accept': 'application/vnd.github.v3+json',
@@ -174,36 +236,49 @@ class GitHubAPIClient:
         if token:
             headers['Authorization'] = f'token {token}'
         
+        # Revalidate expired entries; a 304 carries no body and no rate-limit cost
+        if validator:
+            headers['If-None-Match'] = validator[0]
+        
         self.rate_limit_manager.statistics['total_requests'] += 1
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.request(
-                    method, url, headers=headers, params=params, json=data
-                ) as response:
-                    # Update rate limit info
-                    self.rate_limit_manager.update_rate_limit(token or 'public', dict(response.headers))
-                    
-                    if response.status == 403 and 'rate limit' in response.reason.lower():
-                        self.rate_limit_manager.statistics['rate_limit_hits'] += 1
-                        raise Exception(f"GitHub API rate limit exceeded")
-                    
-                    if response.status == 404:
-                        raise Exception(f"Resource not found: {endpoint}")
-                    
-                    if not response.ok:
-                        error_text = await response.text()
-                        raise Exception(f"GitHub API error {response.status}: {error_text}")
-                    
-                    response_data = await response.json()
-                    response_headers = dict(response.headers)
-                    
-                    # Cache successful GET responses
-                    if method.upper() == 'GET' and use_cache:
-                        self.cache_manager.set(url, (response_data, response_headers), params)
-                    
-                    return response_data, response_headers
-                    
+            session = self._get_session()
+            async with session.request(
+                method, url, headers=headers, params=params, json=data
+            ) as response:
+                # Update rate limit info
+                self.rate_limit_manager.update_rate_limit(token or 'public', dict(response.headers))
+                
+                if response.status == 403 and 'rate limit' in response.reason.lower():
+                    self.rate_limit_manager.statistics['rate_limit_hits'] += 1
+                    raise Exception(f"GitHub API rate limit exceeded")
+                
+                if response.status == 304 and validator:
+                    etag, cached_response = validator
+                    self.cache_manager.set(url, cached_response, params, etag=etag)
+                    self.cache_manager.statistics['revalidated'] += 1
+                    return cached_response
+                
+                if response.status == 404:
+                    raise Exception(f"Resource not found: {endpoint}")
+                
+                if not response.ok:
+                    error_text = await response.text()
+                    raise Exception(f"GitHub API error {response.status}: {error_text}")
+                
+                response_data = await response.json()
+                response_headers = dict(response.headers)
+                
+                # Cache successful GET responses
+                if method.upper() == 'GET' and use_cache:
+                    self.cache_manager.set(
+                        url, (response_data, response_headers), params,
+                        etag=response.headers.get('ETag')
+                    )
+                
+                return response_data, response_headers
+                
         except aiohttp.ClientError as e:
             logger.error(f"GitHub API request failed: {e}")
             raise Exception(f"GitHub API request failed: {e}")
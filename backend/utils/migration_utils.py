@@ -128,47 +128,54 @@ class DataMigrator:
         migrated_count = 0
         
         try:
+            # One lookup for all IDs instead of a query per project
+            existing_ids = await self.db_service.get_existing_project_ids(list(projects_data.keys()))
+            
+            rows = []
             for project_id, project_info in projects_data.items():
-                try:
-                    # Check if project already exists
-                    existing_project = await self.db_service.get_project(project_id)
-                    if existing_project:
-                        logger.info(f"Project {project_id} already exists, skipping")
-                        continue
-                    
-                    # Find the creator user
-                    created_by = project_info.get('created_by')
-                    if not created_by:
-                        logger.warning(f"No creator for project {project_id}, skipping")
-                        continue
-                    
-                    # Prepare project data for database
-                    db_project_data = {
-                        'id': project_id,
-                        'name': project_info.get('name'),
-                        'description': project_info.get('description'),
-                        'repository_url': project_info.get('repository_url'),
-                        'full_name': project_info.get('full_name'),
-                        'language': project_info.get('language'),
-                        'stars': project_info.get('stars', 0),
-                        'forks': project_info.get('forks', 0),
-                        'issues': project_info.get('issues', 0),
-                        'html_url': project_info.get('html_url'),
-                        'created_by': created_by,
-                        'is_beetle_project': project_info.get('is_beetle_project', False),
-                        'settings': project_info.get('settings', {}),
-                        'analytics': project_info.get('analytics', {}),
-                        'recent_activity': project_info.get('recent_activity')
-                    }
-                    
-                    # Create project
-                    await self.db_service.create_project(db_project_data)
-                    migrated_count += 1
-                    logger.info(f"Migrated project: {project_info.get('name')}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to migrate project {project_id}", error=str(e))
+                if project_id in existing_ids:
+                    logger.info(f"Project {project_id} already exists, skipping")
                     continue
+                
+                # Find the creator user
+                created_by = project_info.get('created_by')
+                if not created_by:
+                    logger.warning(f"No creator for project {project_id}, skipping")
+                    continue
+                
+                # Prepare project data for database
+                rows.append({
+                    'id': project_id,
+                    'name': project_info.get('name'),
+                    'description': project_info.get('description'),
+                    'repository_url': project_info.get('repository_url'),
+                    'full_name': project_info.get('full_name'),
+                    'language': project_info.get('language'),
+                    'stars': project_info.get('stars', 0),
+                    'forks': project_info.get('forks', 0),
+                    'issues': project_info.get('issues', 0),
+                    'html_url': project_info.get('html_url'),
+                    'created_by': created_by,
+                    'is_beetle_project': project_info.get('is_beetle_project', False),
+                    'settings': project_info.get('settings', {}),
+                    'analytics': project_info.get('analytics', {}),
+                    'recent_activity': project_info.get('recent_activity')
+                })
+            
+            try:
+                # Insert all projects in a single batched statement
+                migrated_count = await self.db_service.create_projects_bulk(rows)
+            except Exception as e:
+                # Fall back to row-by-row inserts so one bad project does not block the rest
+                logger.warning("Bulk project insert failed, retrying individually", error=str(e))
+                for row in rows:
+                    try:
+                        await self.db_service.create_project(row)
+                        migrated_count += 1
+                        logger.info(f"Migrated project: {row.get('name')}")
+                    except Exception as e:
+                        logger.error(f"Failed to migrate project {row['id']}", error=str(e))
+                        continue
         
         except Exception as e:
             logger.error("Failed to migrate projects", error=str(e))
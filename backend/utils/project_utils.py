@@ -2,6 +2,7 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import structlog
+from cachetools import TTLCache
 
 from config.settings import get_settings
 from utils.github_utils import github_service
@@ -18,26 +19,21 @@ class ProjectCache:
     """Simple in-memory cache for project data"""
     
     def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
         self._cache_ttl = 1800  # 30 minutes TTL
+        # Bounded, and expired entries are dropped even if never read again
+        self._cache: TTLCache = TTLCache(maxsize=1000, ttl=self._cache_ttl)
     
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def get(self, key: str) -> Optional[Any]:
         """Get cached project data"""
-        if key in self._cache:
-            cached_data = self._cache[key]
-            if cached_data.get('expires_at', 0) > datetime.now().timestamp():
-                return cached_data.get('data')
-            else:
-                # Remove expired data
-                del self._cache[key]
-        return None
+        return self._cache.get(key)
     
-    def set(self, key: str, data: Dict[str, Any]) -> None:
+    def set(self, key: str, data: Any) -> None:
         """Cache project data"""
-        self._cache[key] = {
-            'data': data,
-            'expires_at': datetime.now().timestamp() + self._cache_ttl
-        }
+        self._cache[key] = data
+    
+    def delete(self, key: str) -> None:
+        """Remove a single cache entry"""
+        self._cache.pop(key, None)
     
     def clear(self, pattern: Optional[str] = None) -> None:
         """Clear cache entries matching pattern"""
@@ -46,7 +42,7 @@ class ProjectCache:
         else:
             keys_to_remove = [key for key in self._cache.keys() if pattern in key]
             for key in keys_to_remove:
-                del self._cache[key]
+                self._cache.pop(key, None)
 
 # Global cache instance
 project_cache = ProjectCache()
@@ -177,9 +173,10 @@ class ProjectService:
         cache_key = f"project_details:{project_id}"
         
         # Check cache first
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return Project(**cached_data)
+        # Cached as the validated model, so a hit skips the nested rebuild
+        cached_project = self.cache.get(cache_key)
+        if cached_project:
+            return cached_project
         
         try:
             logger.info("Getting project details", project_id=project_id)
@@ -199,7 +196,7 @@ class ProjectService:
             
             if project:
                 # Cache the result
-                self.cache.set(cache_key, project.dict())
+                self.cache.set(cache_key, project)
             
             return project
             
@@ -341,7 +338,7 @@ class ProjectService:
             updated_project = await self.db.save_project(project)
             
             # Clear cache
-            self.cache.clear(f"project_details:{project_id}")
+            self.cache.delete(f"project_details:{project_id}")
             
             return updated_project
             
@@ -532,9 +529,9 @@ class ProjectService:
         cache_key = f"beetle_project:{project_id}"
         
         # Check cache first
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return BeetleProjectData(**cached_data)
+        cached_beetle_data = self.cache.get(cache_key)
+        if cached_beetle_data:
+            return cached_beetle_data
         
         try:
             logger.info("Getting Beetle project data", project_id=project_id)
@@ -550,9 +547,11 @@ class ProjectService:
             repo = url_parts[-1]
             
             # Fetch all branches and their data
-            branches = await github_service.get_repository_branches(owner, repo)
-            issues = await github_service.get_repository_issues(owner, repo, state='all', page=1, per_page=100)
-            pull_requests = await github_service.get_repository_pull_requests(owner, repo, state='all', page=1, per_page=100)
+            branches, issues, pull_requests = await asyncio.gather(
+                github_service.get_repository_branches(owner, repo),
+                github_service.get_repository_issues(owner, repo, state='all', page=1, per_page=100),
+                github_service.get_repository_pull_requests(owner, repo, state='all', page=1, per_page=100)
+            )
             
             # Create branch data with commits for each branch
             branch_data = []
@@ -619,7 +618,7 @@ class ProjectService:
             )
             
             # Cache the result
-            self.cache.set(cache_key, beetle_data.dict())
+            self.cache.set(cache_key, beetle_data)
             
             return beetle_data
             
@@ -0,0 +1,20 @@
+"""
+Lightweight text helpers shared by the chunking, embedding and LLM layers.
+"""
+
+import re
+
+# Maximal runs of non-whitespace, i.e. what ``str.split()`` would return
+_WORD_RE = re.compile(r"\S+")
+
+
+def approx_token_count(text: str) -> int:
+    """Cheap token estimate for coarse size checks.
+
+    Equals ``len(text.split())`` but iterates regex matches instead of
+    building the word list. Runs of whitespace count as one separator, so
+    indentation in code does not inflate the estimate.
+    """
+    if not text:
+        return 0
+    return sum(1 for _ in _WORD_RE.finditer(text))
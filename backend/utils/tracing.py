@@ -1,7 +1,13 @@
 import json, time, os
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def _trace_file():
+    # Resolved on first trace (after .env has been loaded), not per event
+    return os.getenv("TRACE_FILE")
 
 def trace(event: str, payload: dict):
-    trace_file = os.getenv("TRACE_FILE")
+    trace_file = _trace_file()
     if trace_file:
         with open(trace_file, "a") as f:
-            f.write(json.dumps({"ts": time.time(), "event": event, **payload}) + "\n") 
\ No newline at end of file
+            f.write(json.dumps({"ts": time.time(), "event": event, **payload}) + "\n")
@@ -3,6 +3,7 @@ import hashlib
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import structlog
+from cachetools import TTLCache
 
 from config.settings import get_settings
 from models.api.webhook_models import (
@@ -428,9 +429,11 @@ class WebhookRateLimiter:
     """Rate limiter for webhook endpoints"""
     
     def __init__(self):
-        self._request_counts: Dict[str, List[datetime]] = {}
         self._window_size = 60  # 60 seconds
         self._max_requests = 100  # Max requests per window
+        # Each write restarts the entry's TTL, so identifiers that stop
+        # sending are dropped one window after their last request
+        self._request_counts: TTLCache = TTLCache(maxsize=100_000, ttl=self._window_size)
     
     def is_rate_limited(self, identifier: str) -> bool:
         """
@@ -445,37 +448,32 @@ class WebhookRateLimiter:
         now = datetime.now()
         window_start = now.timestamp() - self._window_size
         
-        # Initialize if not exists
-        if identifier not in self._request_counts:
-            self._request_counts[identifier] = []
-        
         # Clean old requests
-        self._request_counts[identifier] = [
-            req_time for req_time in self._request_counts[identifier]
+        request_times = [
+            req_time for req_time in self._request_counts.get(identifier, ())
             if req_time.timestamp() > window_start
         ]
         
         # Check limit
-        if len(self._request_counts[identifier]) >= self._max_requests:
-            return True
+        limited = len(request_times) >= self._max_requests
+        if not limited:
+            # Add current request
+            request_times.append(now)
         
-        # Add current request
-        self._request_counts[identifier].append(now)
-        return False
+        # Store and refresh the expiry in one write
+        self._request_counts[identifier] = request_times
+        return limited
     
     def get_rate_limit_info(self, identifier: str) -> Dict[str, Any]:
         """Get rate limit information for identifier"""
         now = datetime.now()
         window_start = now.timestamp() - self._window_size
         
-        if identifier not in self._request_counts:
-            current_count = 0
-        else:
-            # Count requests in current window
-            current_count = len([
-                req_time for req_time in self._request_counts[identifier]
-                if req_time.timestamp() > window_start
-            ])
+        # Count requests in current window
+        current_count = len([
+            req_time for req_time in self._request_counts.get(identifier, ())
+            if req_time.timestamp() > window_start
+        ])
         
         return {
             "limit": self._max_requests,
@@ -4,13 +4,21 @@ Handles vector storage, retrieval, and management operations with local embeddin
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any, Tuple
+import copy
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Dict, Any, Tuple
+import numpy as np
 import structlog
 from datetime import datetime
 import uuid
 
 from config.settings import get_settings
 from models.api.file_models import DocumentChunk, ChunkMetadata
+from utils.caching import SemanticCache
+from utils.text_utils import approx_token_count
 
 # Try to import Qdrant components, but handle import errors gracefully
 try:
@@ -78,7 +86,8 @@ class EnhancedQdrantClient:
         # Initialize client with FastEmbed support
         client_kwargs = {
             "url": self.url,
-            "prefer_grpc": False,  # Use gRPC for better performance
+            "prefer_grpc": settings.qdrant_prefer_grpc,  # Protobuf over HTTP/2 instead of JSON/REST
+            "grpc_port": settings.qdrant_grpc_port,
             **({"api_key": self.api_key} if self.api_key else {})
         }
         
@@ -88,6 +97,39 @@ class EnhancedQdrantClient:
         self.vector_size = 384  # Default for all-MiniLM-L6-v2
         self.distance = Distance.COSINE
         
+        # With quantization on, search the int8 vectors and rescore an
+        # oversampled candidate set against the originals
+        self._search_params = rest.SearchParams(
+            quantization=rest.QuantizationSearchParams(rescore=True, oversampling=2.0)
+        ) if settings.qdrant_quantize else None
+        
+        # Upsert batching - bulk loads are split across up to upsert_parallel worker processes
+        self.upsert_batch_size = 100
+        self.upsert_parallel = min(8, os.cpu_count() or 1)
+        
+        # Optimizer indexing threshold (KB of vectors); uploads of at least
+        # bulk_load_min_points points run with indexing disabled
+        self.indexing_threshold = 50000
+        self.bulk_load_min_points = 10000
+        # Overlapping bulk loads share one indexing pause: the first entry disables
+        # indexing and the last exit restores it
+        self._bulk_loads = 0
+        self._bulk_lock = asyncio.Lock()
+        
+        # Search results for near-duplicate queries; cleared on every write
+        self._search_cache = SemanticCache(
+            threshold=settings.semantic_cache_threshold,
+            ttl=settings.semantic_cache_ttl
+        ) if settings.semantic_cache_enabled else None
+        
+        # Collection stats are polled by health checks; reuse them briefly
+        self.stats_ttl = 5.0
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Bumped before and after every write; reads only fill the caches when
+        # no write started or finished while they were in flight
+        self._cache_generation = 0
+        
         # FastEmbed integration
         self._fastembed_models = {}
         self._use_fastembed = False
@@ -178,7 +220,7 @@ class EnhancedQdrantClient:
                 default_segment_number=0,
                 max_segment_size=None,
                 memmap_threshold=50000,
-                indexing_threshold=50000,
+                indexing_threshold=self.indexing_threshold,
                 flush_interval_sec=5,
                 max_optimization_threads=0
             )
@@ -195,13 +237,9 @@ class EnhancedQdrantClient:
                     size=self.vector_size,
                     distance=self.distance,
                     on_disk=True,
+                    datatype=self._vector_datatype(),
                     hnsw_config=hnsw_config,
-                    quantization_config=rest.ScalarQuantization(
-                        scalar=rest.ScalarQuantizationConfig(
-                            type=rest.ScalarType.INT8,
-                            quantile=0.99
-                        )
-                    )
+                    quantization_config=self._quantization_config()
                 ),
                 optimizers_config=optimizers_config,
                 wal_config=wal_config,
@@ -213,6 +251,27 @@ class EnhancedQdrantClient:
             logger.error("Failed to create enhanced Qdrant collection", error=str(e))
             raise
     
+    def _quantization_config(self) -> Optional[Any]:
+        """INT8 scalar quantization with the quantized vectors pinned in RAM.
+        
+        Originals stay on disk for rescoring, so memory per vector drops ~4x.
+        """
+        if not settings.qdrant_quantize:
+            return None
+        
+        return rest.ScalarQuantization(
+            scalar=rest.ScalarQuantizationConfig(
+                type=rest.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        )
+    
+    def _vector_datatype(self) -> Optional[Any]:
+        """Storage datatype for original vectors (float16 halves disk and rescoring I/O)."""
+        datatype = settings.qdrant_vector_datatype
+        return rest.Datatype(datatype) if datatype else None
+    
     async def _create_enhanced_indexes(self) -> None:
         """Create enhanced payload indexes for efficient filtering."""
         # Disabled index creation to eliminate warnings
@@ -230,17 +289,27 @@ class EnhancedQdrantClient:
             raise ValueError("FastEmbed not available")
         
         try:
-            if model_name not in self._fastembed_models:
-                from fastembed import TextEmbedding
-                self._fastembed_models[model_name] = TextEmbedding(model_name)
-            
-            embeddings = list(self._fastembed_models[model_name].embed(texts))
-            return [emb.tolist() for emb in embeddings]
+            # Model loading and ONNX inference are blocking; keep them off the
+            # event loop so other requests are served meanwhile
+            return await asyncio.get_event_loop().run_in_executor(
+                None, self._embed_with_fastembed, texts, model_name
+            )
             
         except Exception as e:
             logger.error("FastEmbed generation failed", error=str(e))
             raise
     
+    def _embed_with_fastembed(self, texts: List[str], model_name: str) -> List[List[float]]:
+        """Embed texts with a FastEmbed model, loading it on first use."""
+        if model_name not in self._fastembed_models:
+            from fastembed import TextEmbedding
+            self._fastembed_models[model_name] = TextEmbedding(model_name)
+        
+        # Stack into one contiguous float32 (N, D) matrix and box it in a
+        # single tolist() call rather than once per row
+        matrix = np.asarray(list(self._fastembed_models[model_name].embed(texts)), dtype=np.float32)
+        return matrix.tolist()
+    
     async def upsert_chunks_with_embeddings(
         self, 
         chunks: List[DocumentChunk],
@@ -270,10 +339,7 @@ class EnhancedQdrantClient:
                     # Fallback to orchestrator embeddings provider
                     if not embeddings and orchestrator and hasattr(orchestrator, 'embeddings_provider'):
                         try:
-                            embeddings = []
-                            for text in texts:
-                                embedding = await orchestrator.embeddings_provider.embed_text(text)
-                                embeddings.append(embedding)
+                            embeddings = await orchestrator.embeddings_provider.embed_batch(texts)
                             logger.info(f"Generated {len(embeddings)} embeddings using orchestrator provider")
                         except Exception as e:
                             logger.error(f"Orchestrator embeddings failed: {e}")
@@ -297,72 +363,137 @@ class EnhancedQdrantClient:
         if not chunks:
             return True
         
+        self._invalidate_read_caches()
         try:
-            # Prepare points for insertion
-            points = []
-            for chunk in chunks:
-                if not chunk.embedding:
-                    logger.warning("Chunk has no embedding, skipping", chunk_id=chunk.chunk_id)
-                    continue
-                
-                # Validate embedding dimension
-                embedding_dim = len(chunk.embedding)
-                if embedding_dim != self.vector_size:
-                    logger.error(f"Embedding dimension mismatch: expected {self.vector_size}, got {embedding_dim}", 
-                               chunk_id=chunk.chunk_id, embedding_dim=embedding_dim, expected_dim=self.vector_size)
-                    continue
-                
-                # Enhanced payload with more metadata
-                payload = {
-                    "file_id": chunk.file_id,
-                    "content": chunk.content,
-                    "chunk_index": chunk.metadata.chunk_index,
-                    "start_line": chunk.metadata.start_line,
-                    "end_line": chunk.metadata.end_line,
-                    "start_char": chunk.metadata.start_char,
-                    "end_char": chunk.metadata.end_char,
-                    "chunk_type": chunk.metadata.chunk_type,
-                    "language": chunk.metadata.language,
-                    "complexity_score": chunk.metadata.complexity_score,
-                    "created_at": chunk.created_at.isoformat(),
-                    "filename": getattr(chunk.metadata, 'filename', None),
-                    "file_size": getattr(chunk.metadata, 'file_size', None),
-                    "file_type": getattr(chunk.metadata, 'file_type', None),
-                    "token_count": len(chunk.content.split()),
-                    "word_count": len(chunk.content.split()),
-                    "char_count": len(chunk.content)
-                }
-                
-                # Add any additional metadata
-                if hasattr(chunk.metadata, 'additional_metadata'):
-                    payload.update(chunk.metadata.additional_metadata)
-                
-                point = PointStruct(
-                    id=chunk.chunk_id or str(uuid.uuid4()),
-                    vector=chunk.embedding,
-                    payload=payload
-                )
-                points.append(point)
+            # Points are built lazily as the uploader consumes them, so the full
+            # list of PointStructs is never held alongside the chunks
+            uploaded = 0
+            
+            def iter_points() -> Iterator[PointStruct]:
+                nonlocal uploaded
+                # Chunks of one document share a created_at; format it once per run
+                created_at, created_at_iso = None, None
+                for chunk in chunks:
+                    if chunk.created_at is not created_at:
+                        created_at, created_at_iso = chunk.created_at, chunk.created_at.isoformat()
+                    point = self._chunk_to_point(chunk, created_at_iso)
+                    if point is not None:
+                        uploaded += 1
+                        yield point
+            
+            # Large uploads defer HNSW construction until all points are in
+            if len(chunks) >= self.bulk_load_min_points:
+                async with self.bulk_load():
+                    await self._upload_points(iter_points(), len(chunks))
+            else:
+                await self._upload_points(iter_points(), len(chunks))
             
-            if not points:
+            if not uploaded:
                 logger.warning("No valid points to upsert")
                 return True
             
-            # Upsert points with batching
-            batch_size = 100
-            for i in range(0, len(points), batch_size):
-                batch = points[i:i + batch_size]
-                await self.client.upsert(
-                    collection_name=self.collection_name,
-                    points=batch
-                )
-            
-            logger.info("Successfully upserted chunks", count=len(points))
+            logger.info("Successfully upserted chunks", count=uploaded)
             return True
             
         except Exception as e:
             logger.error("Failed to upsert chunks", error=str(e))
             return False
+        finally:
+            self._invalidate_read_caches()
+    
+    def _chunk_to_point(self, chunk: DocumentChunk, created_at_iso: Optional[str] = None) -> Optional[PointStruct]:
+        """Build a point with enhanced payload, or None if the chunk can't be stored."""
+        if not chunk.embedding:
+            logger.warning("Chunk has no embedding, skipping", chunk_id=chunk.chunk_id)
+            return None
+        
+        # Validate embedding dimension
+        embedding_dim = len(chunk.embedding)
+        if embedding_dim != self.vector_size:
+            logger.error(f"Embedding dimension mismatch: expected {self.vector_size}, got {embedding_dim}", 
+                       chunk_id=chunk.chunk_id, embedding_dim=embedding_dim, expected_dim=self.vector_size)
+            return None
+        
+        # Enhanced payload with more metadata
+        payload = {
+            "file_id": chunk.file_id,
+            "content": chunk.content,
+            "chunk_index": chunk.metadata.chunk_index,
+            "start_line": chunk.metadata.start_line,
+            "end_line": chunk.metadata.end_line,
+            "start_char": chunk.metadata.start_char,
+            "end_char": chunk.metadata.end_char,
+            "chunk_type": chunk.metadata.chunk_type,
+            "language": chunk.metadata.language,
+            "complexity_score": chunk.metadata.complexity_score,
+            "created_at": created_at_iso or chunk.created_at.isoformat(),
+            "filename": getattr(chunk.metadata, 'filename', None),
+            "file_size": getattr(chunk.metadata, 'file_size', None),
+            "file_type": getattr(chunk.metadata, 'file_type', None),
+            "token_count": approx_token_count(chunk.content),
+            "word_count": len(chunk.content.split()),
+            "char_count": len(chunk.content)
+        }
+        
+        # Add any additional metadata
+        if hasattr(chunk.metadata, 'additional_metadata'):
+            payload.update(chunk.metadata.additional_metadata)
+        
+        return PointStruct(
+            id=chunk.chunk_id or str(uuid.uuid4()),
+            vector=chunk.embedding,
+            payload=payload
+        )
+    
+    async def _upload_points(self, points: Iterable[PointStruct], max_points: int) -> None:
+        """Upload points in batches."""
+        # Hand batching to the client's uploader. parallel > 1 starts a process pool
+        # whose workers each re-import the client and reconnect, so only bulk loads
+        # are sharded. The uploader is blocking, so keep it off the event loop.
+        parallel = 1
+        if max_points >= self.bulk_load_min_points:
+            num_batches = -(-max_points // self.upsert_batch_size)
+            parallel = min(self.upsert_parallel, num_batches)
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            partial(
+                self.client.upload_points,
+                collection_name=self.collection_name,
+                points=points,
+                batch_size=self.upsert_batch_size,
+                parallel=parallel,
+                wait=True
+            )
+        )
+    
+    @asynccontextmanager
+    async def bulk_load(self) -> AsyncIterator[None]:
+        """Disable HNSW indexing for the duration of a bulk upload.
+        
+        The optimizer builds the index once when the block exits instead of
+        maintaining the graph while points stream in. Concurrent and nested bulk
+        loads are reference counted, so indexing only resumes after the last one.
+        """
+        async with self._bulk_lock:
+            if self._bulk_loads == 0:
+                await self.client.update_collection(
+                    collection_name=self.collection_name,
+                    optimizers_config=OptimizersConfigDiff(indexing_threshold=0)
+                )
+                logger.info("Bulk load started, HNSW indexing deferred", collection=self.collection_name)
+            self._bulk_loads += 1
+        
+        try:
+            yield
+        finally:
+            async with self._bulk_lock:
+                self._bulk_loads -= 1
+                if self._bulk_loads == 0:
+                    await self.client.update_collection(
+                        collection_name=self.collection_name,
+                        optimizers_config=OptimizersConfigDiff(indexing_threshold=self.indexing_threshold)
+                    )
+                    logger.info("Bulk load finished, HNSW indexing restored", collection=self.collection_name)
     
     async def search_similar(
         self, 
@@ -381,6 +512,15 @@ class EnhancedQdrantClient:
                            query_dim=query_dim, expected_dim=self.vector_size)
                 return []
             
+            # Near-duplicate queries with the same parameters reuse results
+            cache_scope = (limit, score_threshold, offset, repr(sorted(filters.items())) if filters else None)
+            if self._search_cache is not None:
+                cached_results = self._search_cache.get(query_embedding, cache_scope)
+                if cached_results is not None:
+                    # Callers own their results; never hand out the cached dicts
+                    return copy.deepcopy(cached_results)
+            generation = self._cache_generation
+            
             # Build search filter
             search_filter = self._build_enhanced_filter(filters) if filters else None
             
@@ -391,6 +531,7 @@ class EnhancedQdrantClient:
                 limit=limit,
                 score_threshold=score_threshold,
                 query_filter=search_filter,
+                search_params=self._search_params,
                 with_payload=True,
                 with_vectors=False,
                 offset=offset
@@ -406,7 +547,10 @@ class EnhancedQdrantClient:
                     "rank": len(results) + 1 + offset
                 })
             
-            return results
+            if self._search_cache is not None and generation == self._cache_generation:
+                self._search_cache.set(query_embedding, copy.deepcopy(results), cache_scope)
+            
+            return list(results)
             
         except Exception as e:
             logger.error("Enhanced vector search failed", error=str(e))
@@ -438,6 +582,7 @@ class EnhancedQdrantClient:
                     limit=limit,
                     score_threshold=score_threshold,
                     filter=search_filter,
+                    params=self._search_params,
                     with_payload=True,
                     with_vectors=False
                 )
@@ -546,8 +691,16 @@ class EnhancedQdrantClient:
         
         return Filter(must=conditions) if conditions else None
     
+    def _invalidate_read_caches(self) -> None:
+        """Forget cached search results and stats around a collection change."""
+        self._cache_generation += 1
+        self._stats_cache = None
+        if self._search_cache is not None:
+            self._search_cache.clear()
+    
     async def delete_by_file_id(self, file_id: str) -> bool:
         """Delete all chunks for a specific file."""
+        self._invalidate_read_caches()
         try:
             await self.client.delete(
                 collection_name=self.collection_name,
@@ -569,19 +722,28 @@ class EnhancedQdrantClient:
         except Exception as e:
             logger.error("Failed to delete chunks", error=str(e), file_id=file_id)
             return False
+        finally:
+            self._invalidate_read_caches()
     
     async def get_collection_stats(self) -> Dict[str, Any]:
         """Get enhanced collection statistics."""
         try:
-            collection_info = await self.client.get_collection(self.collection_name)
-            
-            # Get additional stats
-            try:
-                points_count = await self.client.count(self.collection_name)
-            except:
+            if self._stats_cache is not None and time.monotonic() - self._stats_cache[0] < self.stats_ttl:
+                return dict(self._stats_cache[1])
+            
+            generation = self._cache_generation
+            # Both requests go out together; a failed count is tolerated
+            collection_info, points_count = await asyncio.gather(
+                self.client.get_collection(self.collection_name),
+                self.client.count(self.collection_name),
+                return_exceptions=True
+            )
+            if isinstance(collection_info, BaseException):
+                raise collection_info
+            if isinstance(points_count, BaseException):
                 points_count = None
             
-            return {
+            stats = {
                 "collection_name": self.collection_name,
                 "vector_size": collection_info.config.params.vectors.size,
                 "distance": str(collection_info.config.params.vectors.distance),
@@ -593,6 +755,9 @@ class EnhancedQdrantClient:
                 "optimizer_status": str(collection_info.optimizer_status),
                 "payload_schema": collection_info.payload_schema
             }
+            if generation == self._cache_generation:
+                self._stats_cache = (time.monotonic(), stats)
+            return dict(stats)
             
         except Exception as e:
             logger.error("Failed to get collection stats", error=str(e))
@@ -680,6 +845,7 @@ class EnhancedQdrantClient:
             
             # Create chunks
             chunks = []
+            created_at = datetime.now()
             for text, embedding, meta in zip(texts, embeddings, metadata):
                 chunk = DocumentChunk(
                     chunk_id=str(uuid.uuid4()),
@@ -699,7 +865,7 @@ class EnhancedQdrantClient:
                         file_size=meta.get("file_size"),
                         file_type=meta.get("file_type")
                     ),
-                    created_at=datetime.now()
+                    created_at=created_at
                 )
                 chunks.append(chunk)
             